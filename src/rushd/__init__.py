@@ -1,3 +1,3 @@
 """rushd - Manage multiple Claude Code instances via tmux."""
 
-__version__ = "0.1.0"
+__version__ = "0.4.0"
@@ -1,19 +1,253 @@
 """CLI interface for rushd."""
 
+import argparse
+import errno
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from rich.console import Console
+    from rich.text import Text
+
+    from .logs import ClaudeLogReader
+    from .manager import ClaudeInstanceManager
+    from .models import InstanceMetadata
+
+
+# Rich markup for each instance status, keyed by InstanceStatus value so the
+# lookup works without importing the models module
+STATUS_DISPLAY: dict[str, str] = {
+    "running": "[green]running[/green]",
+    "starting": "[yellow]starting...[/yellow]",
+    "thinking": "[cyan]thinking*[/cyan]",
+    "tool_use": "[magenta]tool~[/magenta]",
+    "idle": "[blue]idle[/blue]",
+    "stopped": "[red]stopped[/red]",
+    "error": "[red]error![/red]",
+}
+
+# Rich markup for each notification status value
+NOTIFICATION_STATUS_DISPLAY: dict[str, str] = {
+    "success": "[green]success[/green]",
+    "failure": "[red]failure[/red]",
+    "info": "[blue]info[/blue]",
+}
+
+# (header, style) for each column of the `list` table
+LIST_COLUMNS: tuple[tuple[str, Optional[str]], ...] = (
+    ("#", "dim"),
+    ("ID", "cyan"),
+    ("Name", None),
+    ("Status", None),
+    ("Directory", None),
+)
+
+# (header, style) for each column of the `notifications` table
+NOTIFICATION_COLUMNS: tuple[tuple[str, Optional[str]], ...] = (
+    ("Time", "dim"),
+    ("Worker", "cyan"),
+    ("Status", None),
+    ("Message", None),
+    ("Delivered", "dim"),
+)
+
+# Row count above which listings skip Rich's Table layout for plain columns
+TABLE_MAX_ROWS = 50
+
+# Adaptive poll bounds (seconds) for `view --follow`
+FOLLOW_MIN_INTERVAL = 0.2
+FOLLOW_BUSY_INTERVAL = 0.3
+FOLLOW_MAX_INTERVAL = 2.0
+
+# Lines old and new captures must share before new is treated as old scrolled on
+SCROLL_MIN_OVERLAP = 3
+
+
+def _resolve_dir(path: str) -> Path:
+    """Resolve a user-supplied directory, raising FileNotFoundError if missing.
+
+    Other OSErrors (NotADirectoryError for a file, PermissionError) mean it is unusable.
+    """
+    resolved = Path(path).expanduser().resolve(strict=True)
+    if not resolved.is_dir():
+        raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), str(resolved))
+    return resolved
+
+
+def _log_signature(log_reader: "ClaudeLogReader") -> tuple:
+    """
+    Cheap change marker for an instance's session logs.
+
+    Combines the project directory mtime (changes when a new session file
+    appears) with the latest session file's mtime and size.
+    """
+    try:
+        dir_mtime = log_reader.project_dir.stat().st_mtime_ns
+    except OSError:
+        return ()
+    session = log_reader.find_latest_session()
+    if session is None:
+        return (dir_mtime,)
+    try:
+        st = session.stat()
+    except OSError:
+        return (dir_mtime,)
+    return (dir_mtime, str(session), st.st_mtime_ns, st.st_size)
+
+
+def _appended_lines(old: str, new: str) -> Optional[str]:
+    """
+    Return the lines of new that follow on from old, if new only scrolled.
+
+    A fixed-size capture window drops lines from the top as output grows,
+    so new is usually old's trailing lines followed by fresh ones.
+
+    Returns:
+        The added lines, or None if new is not a continuation of old
+    """
+    if not old:
+        return None
+    # A plain extension only counts when old ended on a complete line; otherwise
+    # its last line was still being written and the rest of it is not a new line
+    if new.startswith(old):
+        if old.endswith("\n"):
+            return new[len(old):]
+        # Drop only the newline that ends old's last line; blank lines after it are output
+        if new[len(old):len(old) + 1] == "\n":
+            return new[len(old) + 1:]
+    old_lines = old.splitlines()
+    new_lines = new.splitlines()
+    # Require a few lines of overlap so a repeated prompt line alone
+    # is not mistaken for a scroll
+    for start in range(1, len(old_lines) - SCROLL_MIN_OVERLAP + 1):
+        overlap = old_lines[start:]
+        if new_lines[:len(overlap)] == overlap:
+            return "\n".join(new_lines[len(overlap):])
+    return None
+
+
+def _statuses_fresh(instances: list, max_age: Optional[float]) -> bool:
+    """Check whether refresh_statuses checked every instance within the last max_age seconds."""
+    if max_age is None or not instances:
+        return False
+    from datetime import datetime
+
+    now = datetime.now()
+    return all(
+        inst.last_refreshed is not None
+        and (now - inst.last_refreshed).total_seconds() < max_age
+        for inst in instances
+    )
+
+
+def _instance_row(inst: "InstanceMetadata") -> dict:
+    """Build the JSON record for an instance in `list --json`."""
+    return {
+        "id": inst.id,
+        "name": inst.name,
+        "status": inst.status,
+        "working_dir": inst.working_dir_str,
+        "tmux_window": inst.tmux_window,
+        "created_at": inst.created_at_iso,
+    }
+
+
+def _iso(dt: Optional["datetime"]) -> Optional[str]:
+    """ISO 8601 string for a datetime, or None when it is unset."""
+    return dt.isoformat() if dt else None
+
+
+def _write_json(data) -> None:
+    """Write JSON to stdout, bypassing Rich markup processing.
+
+    Output is indented on a terminal and compact when piped to another program.
+    """
+    from . import jsonutil
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(jsonutil.dumps(data, indent=sys.stdout.isatty()) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Lazily create the shared Rich console."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=64)
+def _markup(markup: str) -> "Text":
+    """Parse a constant markup string once and reuse the Text (combine with +, which copies)."""
+    from rich.text import Text
+
+    return Text.from_markup(markup)
+
+
+def _plain(text: str) -> "Text":
+    """Wrap dynamic text so it is printed verbatim, without markup parsing."""
+    from rich.text import Text
+
+    return Text(str(text))
+
+
+def _print_rows(title: str, columns: tuple, rows: list) -> None:
+    """
+    Print a listing, as a Rich Table for small row counts.
+
+    Large listings are padded into columns in a single pass instead, since
+    Table layout cost grows quickly with the number of rows.
+
+    Args:
+        title: Table title
+        columns: (header, style) for each column
+        rows: Row cells, as markup strings or Text
+    """
+    from rich.text import Text
+
+    if len(rows) <= TABLE_MAX_ROWS:
+        from rich.table import Table
+
+        table = Table(title=title)
+        for header, style in columns:
+            table.add_column(header, style=style)
+        for row in rows:
+            table.add_row(*row)
+        _console().print(table)
+        return
 
-import fire
-from rich.console import Console
-from rich.table import Table
+    cells = [[c if isinstance(c, Text) else Text.from_markup(c) for c in row] for row in rows]
+    widths = [len(header) for header, _ in columns]
+    for row in cells:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], cell.cell_len)
 
-from .config import ConfigManager
-from .manager import ClaudeInstanceManager
-from .models import InstanceStatus, NotificationStatus
+    gap = Text("  ")
+    lines = [
+        Text(title, style="italic"),
+        gap.join(Text(header.ljust(width), style="bold") for (header, _), width in zip(columns, widths)),
+    ]
+    for row in cells:
+        padded = []
+        for cell, (_, style), width in zip(row, columns, widths):
+            cell = cell.copy()
+            if style:
+                cell.stylize(style)
+            cell.pad_right(width - cell.cell_len)
+            padded.append(cell)
+        lines.append(gap.join(padded))
+    _console().print(Text("\n").join(lines))
 
 
-console = Console()
+def _error(message: str) -> None:
+    """Print an error line with the shared pre-parsed prefix."""
+    _console().print(_markup("[red]Error:[/red] ") + _plain(message))
 
 
 class RushdCLI:
@@ -26,22 +260,46 @@ class RushdCLI:
         Args:
             session: Tmux session name for instances (defaults to config value)
         """
+        from .config import ConfigManager
+
         self._config = ConfigManager()
-        config = self._config.load()
-        self._session = session or config.defaults.session_name
-        self._manager: Optional[ClaudeInstanceManager] = None
+        self._loaded_config = self._config.load()
+        self._session = session or self._loaded_config.defaults.session_name
+        self._manager: Optional["ClaudeInstanceManager"] = None
+        self._instance_cache: dict[str, Optional["InstanceMetadata"]] = {}
+        self._primary: Optional[tuple[str, Optional["InstanceMetadata"]]] = None
 
     @property
-    def manager(self) -> ClaudeInstanceManager:
+    def manager(self) -> "ClaudeInstanceManager":
         """Lazy-load the manager."""
         if self._manager is None:
+            from .manager import ClaudeInstanceManager
+
             self._manager = ClaudeInstanceManager(self._session)
         return self._manager
 
+    def _get_instance(self, identifier: str) -> Optional["InstanceMetadata"]:
+        """Look up an instance, reusing the result for the rest of this command."""
+        if identifier not in self._instance_cache:
+            self._instance_cache[identifier] = self.manager.get_instance(identifier)
+        return self._instance_cache[identifier]
+
+    def _invalidate_instances(self) -> None:
+        """Forget cached lookups after a command changes instance state."""
+        self._instance_cache.clear()
+        self._primary = None
+
+    def _primary_inst(self) -> tuple[str, Optional["InstanceMetadata"]]:
+        """Resolve the configured primary once: (name, instance or None)."""
+        if self._primary is None:
+            name = self._loaded_config.primary.name
+            self._primary = (name, self._get_instance(name))
+        return self._primary
+
     def start(
         self,
         name: Optional[str] = None,
-        dir: Optional[str] = None,
+        working_dir: Optional[str] = None,
         model: Optional[str] = None,
         prompt: Optional[str] = None,
         resume: Optional[str] = None,
@@ -52,29 +310,35 @@ class RushdCLI:
 
         Args:
             name: User-friendly name for the instance (defaults to primary)
-            dir: Working directory (defaults to primary working dir)
+            working_dir: Working directory (defaults to primary working dir)
             model: Claude model to use
             prompt: Initial prompt to send
             resume: Session ID to resume
             interactive: If True, don't auto-approve prompts (manual control)
         """
         # If no name or dir specified, use primary config
-        if name is None and dir is None:
-            primary = self._config.get_primary()
+        if name is None and working_dir is None:
+            primary = self._loaded_config.primary
             name = primary.name
-            dir = str(primary.working_dir)
+            working_dir = os.fspath(primary.working_dir)
             model = model or primary.model
             if not interactive:
                 interactive = not primary.auto_approve
-            console.print(f"[dim]Using primary instance defaults[/dim]")
-
-        working_dir = Path(dir).expanduser().resolve() if dir else None
+            _console().print(f"[dim]Using primary instance defaults[/dim]")
 
-        # Validate working directory exists
-        if working_dir and not working_dir.exists():
-            console.print(f"[red]Error:[/red] Working directory does not exist: {working_dir}")
-            console.print("[dim]Create the directory or update ~/.rushd/config.json[/dim]")
-            sys.exit(1)
+        # Resolve and validate the working directory in one step
+        resolved_dir = None
+        if working_dir:
+            try:
+                resolved_dir = _resolve_dir(working_dir)
+            except FileNotFoundError:
+                missing = Path(working_dir).expanduser().resolve()
+                _error(f"Working directory does not exist: {missing}")
+                _console().print("[dim]Create the directory or update ~/.rushd/config.json[/dim]")
+                sys.exit(1)
+            except OSError as e:
+                _error(f"Working directory is not usable: {Path(working_dir).expanduser()} ({e.strerror or e})")
+                sys.exit(1)
 
         # auto_approve is True by default, but False if --interactive is passed
         auto_approve = not interactive
@@ -82,85 +346,77 @@ class RushdCLI:
         try:
             instance = self.manager.start_instance(
                 name=name,
-                working_dir=working_dir,
+                working_dir=resolved_dir,
                 model=model,
                 initial_prompt=prompt,
                 resume=resume,
                 auto_approve=auto_approve,
             )
             display_name = instance.name or instance.id
-            console.print(f"[green]Started instance:[/green] {display_name}")
-            console.print(f"  ID: {instance.id}")
-            console.print(f"  Directory: {instance.working_dir}")
-            console.print(f"  Window: {instance.tmux_window}")
+            lines = [
+                f"[green]Started instance:[/green] {display_name}",
+                f"  ID: {instance.id}",
+                f"  Directory: {instance.working_dir_str}",
+                f"  Window: {instance.tmux_window}",
+            ]
             if auto_approve:
-                console.print(f"  [dim]Auto-approve: enabled (--dangerously-skip-permissions)[/dim]")
+                lines.append("  [dim]Auto-approve: enabled (--dangerously-skip-permissions)[/dim]")
             else:
-                console.print(f"  [yellow]Auto-approve: disabled (interactive mode)[/yellow]")
+                lines.append("  [yellow]Auto-approve: disabled (interactive mode)[/yellow]")
+            _console().print("\n".join(lines))
         except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
+            _error(str(e))
             sys.exit(1)
 
-    def list(self, all: bool = False, json: bool = False) -> None:
+    def list(
+        self,
+        all: bool = False,
+        json: bool = False,
+        no_refresh: bool = False,
+        stale_ok: Optional[float] = None,
+    ) -> None:
         """
         List all managed instances.
 
         Args:
             all: Include stopped instances
             json: Output as JSON
+            no_refresh: Show stored statuses without querying tmux or logs
+            stale_ok: Skip the refresh if every running instance was refreshed within this many seconds
         """
-        # Refresh statuses to detect activity state
-        self.manager.refresh_statuses()
-        instances = self.manager.list_instances(include_stopped=all)
+        if no_refresh:
+            instances = self.manager.store.list_all(include_stopped=all)
+        else:
+            # Refresh statuses to detect activity state (nothing to refresh if
+            # every known instance is already stopped and those are hidden)
+            running = self.manager.store.list_all(include_stopped=False)
+            if (all or running) and not _statuses_fresh(running, stale_ok):
+                # The refresh leaves the store in sync with tmux, so read it back directly
+                self.manager.refresh_statuses()
+                instances = self.manager.store.list_all(include_stopped=all)
+            else:
+                instances = self.manager.list_instances(include_stopped=all)
 
         if json:
-            import json as json_lib
-            data = [
-                {
-                    "id": i.id,
-                    "name": i.name,
-                    "status": i.status,
-                    "working_dir": str(i.working_dir),
-                    "tmux_window": i.tmux_window,
-                    "created_at": i.created_at.isoformat() if i.created_at else None,
-                }
-                for i in instances
-            ]
-            console.print(json_lib.dumps(data, indent=2))
+            _write_json([_instance_row(i) for i in instances])
             return
 
         if not instances:
-            console.print("[dim]No instances. Use 'rushd start' to create one.[/dim]")
+            _console().print("[dim]No instances. Use 'rushd start' to create one.[/dim]")
             return
 
-        table = Table(title="Claude Code Instances")
-        table.add_column("#", style="dim")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name")
-        table.add_column("Status")
-        table.add_column("Directory")
-
-        for i, inst in enumerate(instances, 1):
-            # Enhanced status display with activity indicators
-            status_display = {
-                InstanceStatus.RUNNING: "[green]running[/green]",
-                InstanceStatus.STARTING: "[yellow]starting...[/yellow]",
-                InstanceStatus.THINKING: "[cyan]thinking*[/cyan]",
-                InstanceStatus.TOOL_USE: "[magenta]tool~[/magenta]",
-                InstanceStatus.IDLE: "[blue]idle[/blue]",
-                InstanceStatus.STOPPED: "[red]stopped[/red]",
-                InstanceStatus.ERROR: "[red]error![/red]",
-            }.get(inst.status, f"[white]{inst.status}[/white]")
-
-            table.add_row(
+        rows = [
+            (
                 str(i),
-                inst.id[:8],
+                inst.short_id,
                 inst.name or "-",
-                status_display,
-                str(inst.working_dir),
+                # Enhanced status display with activity indicators
+                _markup(STATUS_DISPLAY.get(inst.status, f"[white]{inst.status}[/white]")),
+                inst.working_dir_str,
             )
-
-        console.print(table)
+            for i, inst in enumerate(instances, 1)
+        ]
+        _print_rows("Claude Code Instances", LIST_COLUMNS, rows)
 
     def stop(self, instance: Optional[str] = None, all: bool = False, force: bool = False) -> None:
         """
@@ -173,20 +429,30 @@ class RushdCLI:
         """
         if all:
             count = self.manager.stop_all(force=force)
-            console.print(f"[green]Stopped {count} instance(s)[/green]")
+            self._invalidate_instances()
+            _console().print(f"[green]Stopped {count} instance(s)[/green]")
             return
 
         if not instance:
-            console.print("[red]Error:[/red] Specify an instance or use --all")
+            _error("Specify an instance or use --all")
             sys.exit(1)
 
-        if self.manager.stop_instance(instance, force=force):
-            console.print(f"[green]Stopped:[/green] {instance}")
+        stopped = self.manager.stop_instance(instance, force=force)
+        self._invalidate_instances()
+        if stopped:
+            _console().print(_markup("[green]Stopped:[/green] ") + _plain(instance))
         else:
-            console.print(f"[red]Error:[/red] Instance not found: {instance}")
+            _error(f"Instance not found: {instance}")
             sys.exit(1)
 
-    def view(self, instance: Optional[str] = None, lines: int = 50, follow: bool = False, activity: bool = False) -> None:
+    def view(
+        self,
+        instance: Optional[str] = None,
+        lines: int = 50,
+        follow: bool = False,
+        activity: bool = False,
+        interval: Optional[float] = None,
+    ) -> None:
         """
         View output from an instance.
 
@@ -195,33 +461,74 @@ class RushdCLI:
             lines: Number of lines to show
             follow: Follow output
             activity: Show structured activity from logs instead of raw terminal
+            interval: Fixed poll interval in seconds for follow (default: adaptive)
         """
         # Default to primary instance
         if instance is None:
-            primary = self._config.get_primary()
-            instance = primary.name
-
-        inst = self.manager.get_instance(instance)
+            instance, inst = self._primary_inst()
+        else:
+            inst = self._get_instance(instance)
         if not inst:
-            console.print(f"[red]Error:[/red] Instance not found: {instance}")
-            console.print("[dim]Start it with 'rushd start'[/dim]")
+            _error(f"Instance not found: {instance}")
+            _console().print("[dim]Start it with 'rushd start'[/dim]")
             sys.exit(1)
 
         if follow:
             import time
+
+            from .models import InstanceStatus
+
             last_output = ""
+            delay = FOLLOW_MIN_INTERVAL
+            log_reader = None
+            last_signature = None
+            if activity:
+                from .logs import ClaudeLogReader
+
+                log_reader = ClaudeLogReader(inst.working_dir)
             try:
                 while True:
-                    if activity:
+                    if log_reader is not None:
+                        # Activity comes from the session log, so a stat() tells us
+                        # whether anything changed without re-reading or parsing it
+                        signature = _log_signature(log_reader)
+                        if signature == last_signature:
+                            # Back off while the log is untouched, as for raw output
+                            delay = min(delay * 2, FOLLOW_MAX_INTERVAL)
+                            time.sleep(interval if interval is not None else delay)
+                            continue
+                        last_signature = signature
                         output = self.manager.get_activity_formatted(instance, last_n=lines)
                     else:
                         output = self.manager.capture_output(instance, lines=lines)
                     if output != last_output:
-                        # Clear and reprint
-                        console.clear()
-                        console.print(output)
+                        added = _appended_lines(last_output, output)
+                        if added is not None:
+                            # Output only scrolled - print just the new lines
+                            if added:
+                                _console().print(added)
+                        else:
+                            # Content shifted or was rewritten - clear and reprint
+                            _console().clear()
+                            _console().print(output)
                         last_output = output
-                    time.sleep(0.5)
+                        delay = FOLLOW_MIN_INTERVAL
+                    else:
+                        # Back off while nothing changes
+                        delay = min(delay * 2, FOLLOW_MAX_INTERVAL)
+
+                    if interval is not None or log_reader is not None:
+                        time.sleep(interval if interval is not None else delay)
+                        continue
+
+                    # Clamp the adaptive delay by what the instance is doing
+                    current = self.manager.get_instance(instance)
+                    status = current.status if current else InstanceStatus.STOPPED
+                    if status in (InstanceStatus.STOPPED, InstanceStatus.IDLE):
+                        delay = FOLLOW_MAX_INTERVAL
+                    elif status in (InstanceStatus.THINKING, InstanceStatus.TOOL_USE):
+                        delay = min(delay, FOLLOW_BUSY_INTERVAL)
+                    time.sleep(delay)
             except KeyboardInterrupt:
                 pass
         else:
@@ -229,7 +536,7 @@ class RushdCLI:
                 output = self.manager.get_activity_formatted(instance, last_n=lines)
             else:
                 output = self.manager.capture_output(instance, lines=lines)
-            console.print(output)
+            _console().print(output)
 
     def send(self, instance_or_message: Optional[str] = None, message="", file: Optional[str] = None) -> None:
         """
@@ -245,40 +552,38 @@ class RushdCLI:
         # Smart detection: if first arg provided but no message, check if it's an instance or message
         if instance is not None and not message and not file:
             # Check if it's actually an instance
-            inst = self.manager.get_instance(instance)
+            inst = self._get_instance(instance)
             if inst is None:
                 # Not an instance - treat it as message to primary
                 message = instance
-                primary = self._config.get_primary()
-                instance = primary.name
+                instance = None
 
         # Default to primary instance if no instance specified
         if instance is None:
-            primary = self._config.get_primary()
-            instance = primary.name
+            instance, inst = self._primary_inst()
+        else:
+            inst = self._get_instance(instance)
 
         # Verify instance exists
-        inst = self.manager.get_instance(instance)
         if not inst:
-            console.print(f"[yellow]Instance '{instance}' not found.[/yellow]")
-            console.print("[dim]Start it with 'rushd start'[/dim]")
+            _console().print(f"[yellow]Instance '{instance}' not found.[/yellow]")
+            _console().print("[dim]Start it with 'rushd start'[/dim]")
             sys.exit(1)
 
         if file:
-            with open(file, "r") as f:
-                message = f.read()
-
-        # Convert message to string (fire may pass int for numeric input)
-        message = str(message)
+            message = Path(file).read_text(encoding="utf-8")
+        elif not isinstance(message, str):
+            # Programmatic callers may pass numbers (e.g., a menu selection)
+            message = str(message)
 
         if not message:
-            console.print("[red]Error:[/red] No message provided")
+            _error("No message provided")
             sys.exit(1)
 
         if self.manager.send_message(instance, message):
-            console.print("[green]Message sent[/green]")
+            _console().print("[green]Message sent[/green]")
         else:
-            console.print(f"[red]Error:[/red] Failed to send to: {instance}")
+            _error(f"Failed to send to: {instance}")
             sys.exit(1)
 
     def attach(self, instance: Optional[str] = None) -> None:
@@ -290,16 +595,15 @@ class RushdCLI:
         """
         # Default to primary instance
         if instance is None:
-            primary = self._config.get_primary()
-            instance = primary.name
-
-        inst = self.manager.get_instance(instance)
+            instance, inst = self._primary_inst()
+        else:
+            inst = self._get_instance(instance)
         if not inst:
-            console.print(f"[red]Error:[/red] Instance not found: {instance}")
-            console.print("[dim]Start it with 'rushd start'[/dim]")
+            _error(f"Instance not found: {instance}")
+            _console().print("[dim]Start it with 'rushd start'[/dim]")
             sys.exit(1)
 
-        console.print(f"Attaching to {inst.name or inst.id}... (Ctrl+B D to detach)")
+        _console().print(f"Attaching to {inst.name or inst.id}... (Ctrl+B D to detach)")
         self.manager.attach(instance)
 
     def log(self, instance: Optional[str] = None) -> None:
@@ -313,23 +617,25 @@ class RushdCLI:
 
         # Default to primary instance
         if instance is None:
-            primary = self._config.get_primary()
-            instance = primary.name
-
-        inst = self.manager.get_instance(instance)
+            instance, inst = self._primary_inst()
+        else:
+            inst = self._get_instance(instance)
         if not inst:
-            console.print(f"[red]Error:[/red] Instance not found: {instance}")
-            console.print("[dim]Start it with 'rushd start'[/dim]")
+            _error(f"Instance not found: {instance}")
+            _console().print("[dim]Start it with 'rushd start'[/dim]")
             sys.exit(1)
 
         log_reader = ClaudeLogReader(inst.working_dir)
         log_path = log_reader.find_latest_session()
 
-        if log_path:
-            console.print(f"[bold]Log file:[/bold] {log_path}")
+        if log_path and not sys.stdout.isatty():
+            # Piped: emit just the path for scripts
+            sys.stdout.write(f"{log_path}\n")
+        elif log_path:
+            _console().print(f"[bold]Log file:[/bold] {log_path}")
         else:
-            console.print(f"[yellow]No log file found for instance {instance}[/yellow]")
-            console.print(f"[dim]Expected location: {log_reader.project_dir}[/dim]")
+            _console().print(f"[yellow]No log file found for instance {instance}[/yellow]")
+            _console().print(f"[dim]Expected location: {log_reader.project_dir}[/dim]")
 
     def status(self, instance: Optional[str] = None) -> None:
         """
@@ -340,30 +646,32 @@ class RushdCLI:
         """
         # Default to primary instance
         if instance is None:
-            primary = self._config.get_primary()
-            instance = primary.name
-
-        inst = self.manager.get_instance(instance)
+            instance, inst = self._primary_inst()
+        else:
+            inst = self._get_instance(instance)
         if not inst:
-            console.print(f"[red]Error:[/red] Instance not found: {instance}")
-            console.print("[dim]Start it with 'rushd start'[/dim]")
+            _error(f"Instance not found: {instance}")
+            _console().print("[dim]Start it with 'rushd start'[/dim]")
             sys.exit(1)
 
-        console.print(f"[bold]Instance: {inst.name or inst.id}[/bold]")
-        console.print(f"  ID: {inst.id}")
-        console.print(f"  Full ID: {inst.full_id}")
-        console.print(f"  Status: {inst.status}")
-        console.print(f"  Directory: {inst.working_dir}")
-        console.print(f"  Tmux Window: {inst.tmux_window}")
-        console.print(f"  Created: {inst.created_at}")
+        lines = [
+            f"[bold]Instance: {inst.name or inst.id}[/bold]",
+            f"  ID: {inst.id}",
+            f"  Full ID: {inst.full_id}",
+            f"  Status: {inst.status}",
+            f"  Directory: {inst.working_dir_str}",
+            f"  Tmux Window: {inst.tmux_window}",
+            f"  Created: {inst.created_at}",
+        ]
         if inst.model:
-            console.print(f"  Model: {inst.model}")
+            lines.append(f"  Model: {inst.model}")
         if inst.last_activity:
-            console.print(f"  Last Activity: {inst.last_activity}")
+            lines.append(f"  Last Activity: {inst.last_activity}")
         if inst.claude_session_id:
-            console.print(f"  Claude Session: {inst.claude_session_id}")
-        console.print(f"  Auto-Approve: {inst.auto_approve}")
-        console.print(f"  Display Mode: {inst.display_mode}")
+            lines.append(f"  Claude Session: {inst.claude_session_id}")
+        lines.append(f"  Auto-Approve: {inst.auto_approve}")
+        lines.append(f"  Display Mode: {inst.display_mode}")
+        _console().print("\n".join(lines))
 
     def remove(self, instance: str) -> None:
         """
@@ -372,21 +680,25 @@ class RushdCLI:
         Args:
             instance: Instance ID or name to remove
         """
-        inst = self.manager.get_instance(instance)
+        from .models import InstanceStatus
+
+        inst = self._get_instance(instance)
         if not inst:
-            console.print(f"[red]Error:[/red] Instance not found: {instance}")
+            _error(f"Instance not found: {instance}")
             sys.exit(1)
 
         if inst.status != InstanceStatus.STOPPED:
             # Check if tmux window still exists
             if self.manager.tmux.window_exists(inst.tmux_window):
-                console.print(f"[red]Error:[/red] Instance is still running. Stop it first with 'rushd stop {instance}'")
+                _error(f"Instance is still running. Stop it first with 'rushd stop {instance}'")
                 sys.exit(1)
 
-        if self.manager.remove_instance(instance):
-            console.print(f"[green]Removed:[/green] {instance}")
+        removed = self.manager.remove_instance(instance)
+        self._invalidate_instances()
+        if removed:
+            _console().print(_markup("[green]Removed:[/green] ") + _plain(instance))
         else:
-            console.print(f"[red]Error:[/red] Failed to remove: {instance}")
+            _error(f"Failed to remove: {instance}")
             sys.exit(1)
 
     def cleanup(self, force: bool = False) -> None:
@@ -399,14 +711,18 @@ class RushdCLI:
         if not force:
             instances = self.manager.list_instances()
             if instances:
-                console.print(f"This will stop {len(instances)} instance(s) and remove the session.")
-                confirm = console.input("Continue? [y/N] ")
+                _console().print(f"This will stop {len(instances)} instance(s) and remove the session.")
+                if not sys.stdin.isatty():
+                    _error("Cannot confirm without a terminal; pass --force")
+                    sys.exit(1)
+                confirm = input("Continue? [y/N] ").strip()
                 if confirm.lower() != "y":
-                    console.print("Cancelled")
+                    _console().print("Cancelled")
                     return
 
         self.manager.cleanup(force=True)
-        console.print("[green]Cleanup complete[/green]")
+        self._invalidate_instances()
+        _console().print("[green]Cleanup complete[/green]")
 
     def config(self, show: bool = False, init: bool = False) -> None:
         """
@@ -418,52 +734,50 @@ class RushdCLI:
         """
         if init:
             if self._config.exists():
-                console.print("[yellow]Config already exists at ~/.rushd/config.json[/yellow]")
-                console.print("[dim]Use --show to view current config[/dim]")
+                _console().print("[yellow]Config already exists at ~/.rushd/config.json[/yellow]")
+                _console().print("[dim]Use --show to view current config[/dim]")
                 return
             from .config import RushdConfig
             config = RushdConfig()
             self._config.save(config)
-            console.print("[green]Created config file at ~/.rushd/config.json[/green]")
+            _console().print("[green]Created config file at ~/.rushd/config.json[/green]")
             return
 
         # Default to showing config
-        config = self._config.load()
-        import json as json_lib
-        console.print(json_lib.dumps(config.model_dump(mode="json"), indent=2, default=str))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(self._config.dump_json(indent=sys.stdout.isatty()))
+        sys.stdout.buffer.flush()
 
     def discord(self) -> None:
         """Start the Discord bot bridge for the primary instance."""
-        import os
-
-        config = self._config.load()
+        config = self._loaded_config
         if not config.discord.enabled:
-            console.print("[red]Error:[/red] Discord not enabled in config")
-            console.print("[dim]Set discord.enabled = true in ~/.rushd/config.json[/dim]")
+            _error("Discord not enabled in config")
+            _console().print("[dim]Set discord.enabled = true in ~/.rushd/config.json[/dim]")
             return
 
         token = os.environ.get("RUSHD_DISCORD_TOKEN")
         if not token:
-            console.print("[red]Error:[/red] RUSHD_DISCORD_TOKEN environment variable not set")
+            _error("RUSHD_DISCORD_TOKEN environment variable not set")
             return
 
         if not config.discord.guild_id:
-            console.print("[red]Error:[/red] discord.guild_id not set in config")
-            console.print("[dim]Right-click your server → Copy Server ID[/dim]")
+            _error("discord.guild_id not set in config")
+            _console().print("[dim]Right-click your server → Copy Server ID[/dim]")
             return
 
         if not config.discord.allowed_users:
-            console.print("[yellow]Warning:[/yellow] No allowed_users configured")
-            console.print("[dim]Add your Discord username to discord.allowed_users[/dim]")
+            _console().print("[yellow]Warning:[/yellow] No allowed_users configured")
+            _console().print("[dim]Add your Discord username to discord.allowed_users[/dim]")
 
         primary_name = config.primary.name
         if not self.manager.is_primary_running(primary_name):
-            console.print("[yellow]Warning:[/yellow] Primary instance not running")
-            console.print("[dim]Start it with 'rushd start'[/dim]")
+            _console().print("[yellow]Warning:[/yellow] Primary instance not running")
+            _console().print("[dim]Start it with 'rushd start'[/dim]")
 
         from .discord_bot import run_discord_bot
-        console.print(f"[green]Starting Discord bot for '{primary_name}'...[/green]")
-        console.print("[dim]Channels will be auto-created if needed[/dim]")
+        _console().print(f"[green]Starting Discord bot for '{primary_name}'...[/green]")
+        _console().print("[dim]Channels will be auto-created if needed[/dim]")
         run_discord_bot(self.manager, config.discord, self._config, primary_name, token)
 
     def responses(self, limit: int = 20, json: bool = False) -> None:
@@ -474,39 +788,47 @@ class RushdCLI:
             limit: Maximum number of responses to show (default: 20)
             json: Output as JSON
         """
-        import json as json_lib
+        import heapq
 
-        responses_dir = Path.home() / ".rushd" / "responses"
-        if not responses_dir.exists():
-            console.print("[dim]No responses found. Run Discord bot to capture responses.[/dim]")
-            return
+        from . import jsonutil
+        from .config import RESPONSES_DIR
 
-        # Read response files, sorted by timestamp (newest first)
-        files = sorted(responses_dir.glob("*.json"), reverse=True)[:limit]
+        try:
+            with os.scandir(RESPONSES_DIR) as it:
+                # File names start with a sortable timestamp, so the newest
+                # `limit` can be picked without sorting the whole directory
+                entries = heapq.nlargest(
+                    limit,
+                    (e for e in it if e.name.endswith(".json") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except FileNotFoundError:
+            _console().print("[dim]No responses found. Run Discord bot to capture responses.[/dim]")
+            return
 
         responses_list = []
-        for f in files:
+        for entry in entries:
             try:
-                data = json_lib.loads(f.read_text())
-                responses_list.append(data)
-            except Exception:
+                with open(entry.path, "rb") as f:
+                    responses_list.append(jsonutil.loads(f.read()))
+            except (OSError, ValueError):
                 pass
 
         if json:
-            console.print(json_lib.dumps(responses_list, indent=2))
+            _write_json(responses_list)
             return
 
         if not responses_list:
-            console.print("[dim]No responses found[/dim]")
+            _console().print("[dim]No responses found[/dim]")
             return
 
         # Show oldest first for natural reading order
         for resp in reversed(responses_list):
             time_str = resp.get("timestamp", "")[:19]
             text = resp.get("text", "")
-            console.print(f"[dim]{time_str}[/dim]")
-            console.print(text)
-            console.print()
+            _console().print(f"[dim]{time_str}[/dim]")
+            _console().print(text)
+            _console().print()
 
     def verify_panes(self, fix: bool = False, json: bool = False) -> None:
         """
@@ -520,49 +842,40 @@ class RushdCLI:
             json: Output as JSON
         """
         instances = self.manager.list_instances(include_stopped=False)
-        tmux_windows = self.manager.tmux.list_windows()
-
-        # Build lookup by window name
-        window_by_name: dict[str, dict] = {}
-        for w in tmux_windows:
-            window_by_name[w["name"]] = w
-
-        results = []
-        fixes_applied = 0
+        window_by_name = {w["name"]: w for w in self.manager.tmux.list_windows()}
 
-        for inst in instances:
-            window_name = inst.name or inst.id
-            actual_window = window_by_name.get(window_name)
-
-            result = {
+        results = [
+            {
                 "instance_id": inst.id,
                 "name": inst.name,
                 "stored_pane_id": inst.tmux_pane_id,
-                "actual_pane_id": actual_window["pane_id"] if actual_window else None,
-                "window_exists": actual_window is not None,
-                "match": False,
+                "actual_pane_id": actual["pane_id"] if actual else None,
+                "window_exists": actual is not None,
+                "match": actual is not None and inst.tmux_pane_id == actual["pane_id"],
                 "fixed": False,
             }
+            for inst in instances
+            for actual in (window_by_name.get(inst.name or inst.id),)
+        ]
 
-            if actual_window:
-                result["match"] = inst.tmux_pane_id == actual_window["pane_id"]
-
-                if not result["match"] and fix:
+        fixes_applied = 0
+        if fix:
+            for r in results:
+                if r["window_exists"] and not r["match"]:
                     # Update the stored pane ID
                     self.manager.store.update(
-                        inst.id,
-                        tmux_pane_id=actual_window["pane_id"]
+                        r["instance_id"],
+                        tmux_pane_id=r["actual_pane_id"]
                     )
-                    result["fixed"] = True
+                    r["fixed"] = True
                     fixes_applied += 1
 
-            results.append(result)
-
         if json:
-            import json as json_lib
-            console.print(json_lib.dumps(results, indent=2))
+            _write_json(results)
             return
 
+        from rich.table import Table
+
         # Display results as table
         table = Table(title="Pane ID Verification")
         table.add_column("Instance", style="cyan")
@@ -586,25 +899,25 @@ class RushdCLI:
 
             table.add_row(name, stored, actual, status)
 
-        console.print(table)
+        _console().print(table)
 
         # Summary
         mismatches = sum(1 for r in results if not r["match"] and r["window_exists"])
         missing = sum(1 for r in results if not r["window_exists"])
 
         if mismatches > 0 or missing > 0:
-            console.print()
+            _console().print()
             if mismatches > 0:
                 if fix:
-                    console.print(f"[green]Fixed {fixes_applied} mismatched pane ID(s)[/green]")
+                    _console().print(f"[green]Fixed {fixes_applied} mismatched pane ID(s)[/green]")
                 else:
-                    console.print(f"[yellow]{mismatches} mismatched pane ID(s) found[/yellow]")
-                    console.print("[dim]Run with --fix to update stored values[/dim]")
+                    _console().print(f"[yellow]{mismatches} mismatched pane ID(s) found[/yellow]")
+                    _console().print("[dim]Run with --fix to update stored values[/dim]")
             if missing > 0:
-                console.print(f"[yellow]{missing} instance(s) have no tmux window[/yellow]")
-                console.print("[dim]These instances may need to be removed[/dim]")
+                _console().print(f"[yellow]{missing} instance(s) have no tmux window[/yellow]")
+                _console().print("[dim]These instances may need to be removed[/dim]")
         else:
-            console.print("[green]All pane IDs verified correctly[/green]")
+            _console().print("[green]All pane IDs verified correctly[/green]")
 
     def notifications(
         self,
@@ -629,7 +942,6 @@ class RushdCLI:
         )
 
         if json:
-            import json as json_lib
             data = [
                 {
                     "id": n.id,
@@ -637,49 +949,131 @@ class RushdCLI:
                     "worker_name": n.worker_name,
                     "status": n.status,
                     "message": n.message,
-                    "created_at": n.created_at.isoformat() if n.created_at else None,
+                    "created_at": _iso(n.created_at),
                     "delivered": n.delivered,
-                    "delivered_at": n.delivered_at.isoformat() if n.delivered_at else None,
+                    "delivered_at": _iso(n.delivered_at),
                 }
                 for n in notifications_list
             ]
-            console.print(json_lib.dumps(data, indent=2))
+            _write_json(data)
             return
 
         if not notifications_list:
-            console.print("[dim]No notifications found[/dim]")
+            _console().print("[dim]No notifications found[/dim]")
             return
 
-        table = Table(title="Worker Notifications")
-        table.add_column("Time", style="dim")
-        table.add_column("Worker", style="cyan")
-        table.add_column("Status")
-        table.add_column("Message")
-        table.add_column("Delivered", style="dim")
+        rows = [
+            (
+                n.created_at.isoformat(sep=" ", timespec="seconds") if n.created_at else "-",
+                n.worker_name or n.worker_id,
+                NOTIFICATION_STATUS_DISPLAY.get(n.status, n.status),
+                n.message or "-",
+                "[green]Yes[/green]" if n.delivered else "[yellow]No[/yellow]",
+            )
+            for n in notifications_list
+        ]
+        _print_rows("Worker Notifications", NOTIFICATION_COLUMNS, rows)
 
-        for n in notifications_list:
-            # Format time
-            time_str = n.created_at.strftime("%Y-%m-%d %H:%M:%S") if n.created_at else "-"
 
-            # Status with color
-            status_display = {
-                "success": "[green]success[/green]",
-                "failure": "[red]failure[/red]",
-                "info": "[blue]info[/blue]",
-            }.get(n.status, n.status)
+class _VersionAction(argparse.Action):
+    """Print the installed version, looking it up only when requested."""
 
-            # Delivered indicator
-            delivered_str = "[green]Yes[/green]" if n.delivered else "[yellow]No[/yellow]"
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
 
-            table.add_row(
-                time_str,
-                n.worker_name or n.worker_id,
-                status_display,
-                n.message or "-",
-                delivered_str,
-            )
+    def __call__(self, parser, namespace, values, option_string=None):
+        from importlib.metadata import PackageNotFoundError, version
 
-        console.print(table)
+        try:
+            installed = version("rushd")
+        except PackageNotFoundError:
+            from . import __version__ as installed
+        parser.exit(message=f"rushd {installed}\n")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per RushdCLI method."""
+    parser = argparse.ArgumentParser(
+        prog="rushd",
+        description="Manage multiple Claude Code instances via tmux. "
+        "Run with no arguments to launch the interactive TUI.",
+    )
+    parser.add_argument("--version", action=_VersionAction, help="Show the installed version and exit")
+    parser.add_argument("--session", help="Tmux session name for instances (defaults to config value)")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    sp = sub.add_parser("start", help="Start a new Claude Code instance")
+    sp.add_argument("-n", "--name", help="User-friendly name for the instance (defaults to primary)")
+    sp.add_argument("-d", "--dir", dest="working_dir", metavar="DIR", help="Working directory (defaults to primary working dir)")
+    sp.add_argument("-m", "--model", help="Claude model to use")
+    sp.add_argument("-p", "--prompt", help="Initial prompt to send")
+    sp.add_argument("--resume", help="Session ID to resume")
+    sp.add_argument("--interactive", action="store_true", help="Don't auto-approve prompts (manual control)")
+
+    sp = sub.add_parser("list", help="List all managed instances")
+    sp.add_argument("--all", action="store_true", help="Include stopped instances")
+    sp.add_argument("--json", action="store_true", help="Output as JSON")
+    sp.add_argument("--no-refresh", action="store_true", help="Show stored statuses without querying tmux")
+    sp.add_argument(
+        "--stale-ok", type=float, metavar="SECONDS",
+        help="Reuse stored statuses refreshed within the last SECONDS",
+    )
+
+    sp = sub.add_parser("stop", help="Stop a Claude Code instance")
+    sp.add_argument("instance", nargs="?", help="Instance ID or name to stop")
+    sp.add_argument("--all", action="store_true", help="Stop all instances")
+    sp.add_argument("--force", action="store_true", help="Force kill without graceful shutdown")
+
+    sp = sub.add_parser("view", help="View output from an instance")
+    sp.add_argument("instance", nargs="?", help="Instance ID or name (defaults to primary)")
+    sp.add_argument("--lines", type=int, default=50, help="Number of lines to show")
+    sp.add_argument("-f", "--follow", action="store_true", help="Follow output")
+    sp.add_argument("--activity", action="store_true", help="Show structured activity from logs")
+    sp.add_argument("--interval", type=float, help="Fixed poll interval in seconds for --follow (default: adaptive)")
+
+    sp = sub.add_parser("send", help="Send a message to an instance")
+    sp.add_argument("instance_or_message", nargs="?", help="Instance ID/name, or message if no instance specified")
+    sp.add_argument("message", nargs="?", default="", help="Message to send (when instance is specified)")
+    sp.add_argument("--file", help="Read message from file")
+
+    for name, help_text in [
+        ("attach", "Attach to an instance's tmux window"),
+        ("log", "Show the conversation log path for an instance"),
+        ("status", "Show detailed status of an instance"),
+    ]:
+        sp = sub.add_parser(name, help=help_text)
+        sp.add_argument("instance", nargs="?", help="Instance ID or name (defaults to primary)")
+
+    sp = sub.add_parser("remove", help="Remove an instance from storage (must be stopped first)")
+    sp.add_argument("instance", help="Instance ID or name to remove")
+
+    sp = sub.add_parser("cleanup", help="Stop all instances and remove the tmux session")
+    sp.add_argument("--force", action="store_true", help="Skip confirmation")
+
+    sp = sub.add_parser("config", help="Manage rushd configuration")
+    sp.add_argument("--show", action="store_true", help="Display current configuration")
+    sp.add_argument("--init", action="store_true", help="Initialize config file with defaults")
+
+    sub.add_parser("discord", help="Start the Discord bot bridge for the primary instance")
+
+    sp = sub.add_parser("responses", help="View Claude responses that were sent to Discord")
+    sp.add_argument("--limit", type=int, default=20, help="Maximum number of responses to show")
+    sp.add_argument("--json", action="store_true", help="Output as JSON")
+
+    sp = sub.add_parser(
+        "verify_panes", aliases=["verify-panes"], help="Verify stored pane IDs match actual tmux panes"
+    )
+    sp.set_defaults(command="verify_panes")
+    sp.add_argument("--fix", action="store_true", help="Automatically fix mismatched pane IDs")
+    sp.add_argument("--json", action="store_true", help="Output as JSON")
+
+    sp = sub.add_parser("notifications", help="List worker notifications")
+    sp.add_argument("--worker", help="Filter by worker instance ID or name")
+    sp.add_argument("--limit", type=int, default=20, help="Maximum number of notifications to show")
+    sp.add_argument("--undelivered", action="store_true", help="Only show undelivered notifications")
+    sp.add_argument("--json", action="store_true", help="Output as JSON")
+
+    return parser
 
 
 def main():
@@ -688,17 +1082,20 @@ def main():
     if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ["-i", "--interactive"]):
         from .tui import run_tui
 
-        result = run_tui()
+        # run_tui handles attach requests with the TUI's own manager
+        run_tui()
+        return
 
-        # Handle attach request
-        if result == "attach":
-            # Get the selected instance and attach
-            manager = ClaudeInstanceManager()
-            instances = manager.list_instances()
-            if instances:
-                manager.attach(instances[0].id)
-    else:
-        fire.Fire(RushdCLI)
+    parser = _build_parser()
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    kwargs = vars(args)
+    command = kwargs.pop("command")
+    session = kwargs.pop("session")
+    getattr(RushdCLI(session=session), command)(**kwargs)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,30 @@
 """User configuration management for rushd."""
 
-import json
+import os
+import time
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+# Locations under ~/.rushd, resolved once at import
+RUSHD_HOME = Path.home() / ".rushd"
+CONFIG_PATH = RUSHD_HOME / "config.json"
+INSTANCES_PATH = RUSHD_HOME / "instances.json"
+NOTIFICATIONS_DIR = RUSHD_HOME / "notifications"
+RESPONSES_DIR = RUSHD_HOME / "responses"
+SCREENSHOTS_DIR = RUSHD_HOME / "screenshots"
+
+# Filesystem timestamps are coarse, so a rewrite within one tick can leave a file's
+# (or directory's) mtime unchanged; stat-keyed caches only trust mtimes older than this
+RACY_MTIME_NS = 1_000_000_000
+
+
+def mtime_trusted(mtime_ns: int, now_ns: Optional[int] = None) -> bool:
+    """Whether an st_mtime_ns is old enough (see RACY_MTIME_NS) to key a cache on."""
+    if now_ns is None:
+        now_ns = time.time_ns()
+    return now_ns - mtime_ns > RACY_MTIME_NS
 
 
 class PrimaryConfig(BaseModel):
@@ -60,29 +80,105 @@ class RushdConfig(BaseModel):
 class ConfigManager:
     """Manages user configuration at ~/.rushd/config.json."""
 
+    # Parsed configs shared by every manager in the process:
+    # path -> (st_mtime_ns, st_size, trusted, raw bytes, config)
+    _cache: dict[Path, tuple[int, int, bool, bytes, RushdConfig]] = {}
+    # Serialized configs for `rushd config`:
+    # (path, indent) -> (st_mtime_ns, st_size, bytes)
+    _dump_cache: dict[tuple[Path, bool], tuple[int, int, bytes]] = {}
+
     def __init__(self, config_path: Optional[Path] = None):
-        self.config_path = config_path or Path.home() / ".rushd" / "config.json"
+        self.config_path = config_path or CONFIG_PATH
 
     def _ensure_dir(self) -> None:
         """Ensure the config directory exists."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _stat_key(self) -> Optional[tuple[int, int]]:
+        """Return (st_mtime_ns, st_size) for the config file, or None if missing."""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def load(self) -> RushdConfig:
-        """Load configuration, returning defaults if not found."""
-        if not self.config_path.exists():
+        """Load configuration, returning defaults if not found.
+
+        The parsed config is cached and reused until the file's mtime or size changes.
+        A file whose mtime is too fresh to trust (see mtime_trusted) is re-read and
+        its bytes compared instead, which still skips parsing when they match.
+        """
+        key = self._stat_key()
+        if key is None:
+            self.invalidate()
             return RushdConfig()
+        cached = self._cache.get(self.config_path)
+        if cached is not None and cached[:2] == key and cached[2]:
+            return cached[4]
         try:
-            with open(self.config_path, "r") as f:
-                data = json.load(f)
-            return RushdConfig.model_validate(data)
-        except (json.JSONDecodeError, IOError):
+            with open(self.config_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                data = f.read()
+        except OSError:
             return RushdConfig()
+        key = (st.st_mtime_ns, st.st_size)
+        if cached is not None and cached[3] == data:
+            config = cached[4]
+        else:
+            try:
+                # pydantic-core parses and validates in one pass, without an intermediate dict
+                config = RushdConfig.model_validate_json(data)
+            except ValidationError as e:
+                if any(err["type"] == "json_invalid" for err in e.errors()):
+                    return RushdConfig()
+                raise
+        self._cache[self.config_path] = (*key, mtime_trusted(key[0]), data, config)
+        return config
+
+    def invalidate(self) -> None:
+        """Drop the cached config so the next load re-reads the file."""
+        self._cache.pop(self.config_path, None)
+        for indent in (True, False):
+            self._dump_cache.pop((self.config_path, indent), None)
+
+    def dump_json(self, indent: bool = True) -> bytes:
+        """
+        JSON of the current config, cached by file mtime and size once the mtime is trusted.
+
+        Args:
+            indent: Pretty-print instead of emitting compact JSON
+        """
+        key = self._stat_key()
+        cache_key = (self.config_path, indent)
+        cached = self._dump_cache.get(cache_key)
+        if key is not None and cached is not None and cached[:2] == key:
+            return cached[2]
+        data = self.load().model_dump_json(indent=2 if indent else None).encode() + b"\n"
+        if key is not None and mtime_trusted(key[0]):
+            self._dump_cache[cache_key] = (*key, data)
+        return data
 
     def save(self, config: RushdConfig) -> None:
-        """Save configuration to disk."""
-        self._ensure_dir()
-        with open(self.config_path, "w") as f:
-            json.dump(config.model_dump(mode="json"), f, indent=2, default=str)
+        """Save configuration to disk.
+
+        The file is replaced atomically, and left untouched if its contents
+        would not change.
+        """
+        payload = config.model_dump_json(indent=2).encode()
+        try:
+            if self.config_path.read_bytes() == payload:
+                return
+        except OSError:
+            self._ensure_dir()
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.config_path)
+        self.invalidate()
+        # The saved model is what the file now holds, so later loads can skip parsing it
+        key = self._stat_key()
+        if key is not None:
+            self._cache[self.config_path] = (*key, mtime_trusted(key[0]), payload, config)
 
     def get_primary(self) -> PrimaryConfig:
         """Get primary instance configuration."""
@@ -1,8 +1,8 @@
 """Discord bot integration for rushd."""
 
 import asyncio
-import hashlib
-import json
+import logging
+import os
 import time
 from datetime import datetime
 from pathlib import Path
@@ -10,16 +10,19 @@ from typing import Optional
 
 import discord
 
-from .config import ConfigManager, DiscordConfig, DiscordChannels
-from .logs import LogEntry, ActivityState
+from . import jsonutil
+from .config import RESPONSES_DIR, SCREENSHOTS_DIR, ConfigManager, DiscordConfig, DiscordChannels
+from .logs import LogCursor, LogEntry, ActivityState
 from .manager import ClaudeInstanceManager
 
+logger = logging.getLogger(__name__)
+
 
 def truncate(text: str, max_len: int) -> str:
     """Truncate text with ellipsis if too long."""
     if len(text) <= max_len:
         return text
-    return text[: max_len - 3] + "..."
+    return f"{text[: max_len - 3]}..."
 
 
 def split_message(text: str, max_len: int) -> list[str]:
@@ -27,41 +30,61 @@ def split_message(text: str, max_len: int) -> list[str]:
     if not text:
         return [""]
     chunks = []
-    while text:
-        if len(text) <= max_len:
-            chunks.append(text)
+    # Walk an offset through text rather than re-slicing the remainder each chunk
+    start = 0
+    end = len(text)
+    while start < end:
+        if end - start <= max_len:
+            chunks.append(text[start:])
             break
         # Find best split point (sentence > paragraph > word > hard limit)
-        split_at = max_len
-        for sep in [". ", ".\n", "! ", "? ", "\n\n", "\n", " "]:
-            pos = text.rfind(sep, 0, max_len)
-            if pos > max_len // 2:  # Don't split too early
+        limit = start + max_len
+        split_at = limit
+        for sep in (". ", ".\n", "! ", "? ", "\n\n", "\n", " "):
+            pos = text.rfind(sep, start, limit)
+            if pos - start > max_len // 2:  # Don't split too early
                 split_at = pos + len(sep.rstrip())
                 break
-        chunks.append(text[:split_at].rstrip())
-        text = text[split_at:].lstrip()
+        chunks.append(text[start:split_at].rstrip())
+        start = split_at
+        while start < end and text[start].isspace():
+            start += 1
     return chunks if chunks else [""]
 
 
-def hash_entry(entry: LogEntry) -> str:
-    """Create unique hash for a log entry using UUID."""
-    # UUID is unique per entry, making this reliable
-    if entry.uuid:
-        return entry.uuid
-    # Fallback for entries without UUID
-    content = f"{entry.timestamp}:{entry.type}:{entry.tool_name}"
-    return hashlib.md5(content.encode()).hexdigest()[:16]
+def pack_messages(parts: list[str], max_len: int) -> list[str]:
+    """Greedily join parts with newlines into as few messages as fit max_len."""
+    messages: list[str] = []
+    current = ""
+    for part in parts:
+        if current and len(current) + 1 + len(part) <= max_len:
+            current = f"{current}\n{part}"
+        else:
+            if current:
+                messages.append(current)
+            current = part
+    if current:
+        messages.append(current)
+    return messages
 
 
 class RushdDiscordBot(discord.Client):
     """Discord bot that bridges rushd primary instance with Discord."""
 
-    CHANNEL_SUFFIXES = {
-        "activity": "activity",
-        "responses": "responses",
-        "status": "status",
-        "commands": "commands",
-        "live_view": "live-view",
+    # (config key, channel name suffix, topic) for each managed channel
+    CHANNEL_SPECS = (
+        ("activity", "activity", "Full activity stream from Claude (thinking, tools, results)"),
+        ("responses", "responses", "Claude's text responses only"),
+        ("status", "status", "Status notifications (working, idle, done)"),
+        ("commands", "commands", "Send commands to Claude here"),
+        ("live_view", "live-view", "Live view of Claude's activity (auto-updating)"),
+    )
+
+    # Status messages that don't depend on the activity details
+    STATUS_MESSAGES = {
+        "thinking": "🤔 Claude is thinking...",
+        "running": "⚡ Claude is working...",
+        "unknown": "❓ Status unknown",
     }
 
     def __init__(
@@ -80,26 +103,74 @@ class RushdDiscordBot(discord.Client):
         self.config = config
         self.config_manager = config_manager
         self.primary_name = primary_name
-        self.seen_entries: set[str] = set()
+        # Two generations of dedupe keys: when the current one fills up it becomes
+        # the previous one, and the old previous generation is dropped wholesale
+        self.seen_entries: set[int] = set()
+        self._seen_previous: set[int] = set()
+        # Where the monitor loop stopped reading the primary's session log
+        self._log_cursor: LogCursor = LogCursor()
         self.last_status: str = "unknown"
         self._clearing: bool = False  # Flag to pause monitor during /clear
         self._awaiting_plan_approval: bool = False  # Flag when ExitPlanMode was called
         self._live_view_message_id: Optional[int] = None
+        self._background_tasks: set[asyncio.Task] = set()  # fire-and-forget sends
+        self._live_view_output: Optional[str] = None  # Activity text last posted to live view
         self._last_live_view_update: float = 0
+        # Last monitor error as (type, message) and how many times in a row it occurred
+        self._last_error: Optional[tuple[type, str]] = None
+        self._error_repeats: int = 0
+        # Resolved channel objects by CHANNEL_SPECS key, refreshed in on_ready
+        self._channels: dict[str, discord.abc.Messageable] = {}
 
     # Keywords that indicate plan approval (case-insensitive)
-    APPROVAL_KEYWORDS = {"yes", "y", "approve", "ok", "proceed", "lgtm", "looks good", "go ahead", "approved"}
+    APPROVAL_KEYWORDS = frozenset({"yes", "y", "approve", "ok", "proceed", "lgtm", "looks good", "go ahead", "approved"})
+
+    # Pause between selecting the plan "modify" option and typing feedback
+    FEEDBACK_SETTLE_SECONDS = 0.05
 
     # Directory for storing screenshots from Discord
-    SCREENSHOT_DIR = Path.home() / ".rushd" / "screenshots"
+    SCREENSHOT_DIR = SCREENSHOTS_DIR
+
+    # Keys per seen-entry generation; between this and twice this many are remembered
+    SEEN_ENTRIES_LIMIT = 2048
+
+    # A monitor error repeated back-to-back is only reported every Nth time
+    ERROR_REPEAT_INTERVAL = 30
+
+    def _is_seen(self, entry_key: int) -> bool:
+        """Check both seen-entry generations for a dedupe key."""
+        return entry_key in self.seen_entries or entry_key in self._seen_previous
+
+    def _mark_seen(self, entry_key: int) -> None:
+        """Remember an entry's dedupe key, rotating generations past SEEN_ENTRIES_LIMIT."""
+        self.seen_entries.add(entry_key)
+        if len(self.seen_entries) >= self.SEEN_ENTRIES_LIMIT:
+            self._seen_previous = self.seen_entries
+            self.seen_entries = set()
+
+    def _seen_count(self) -> int:
+        """Number of dedupe keys currently remembered."""
+        return len(self.seen_entries) + len(self._seen_previous)
 
     def _get_channel_name(self, suffix: str) -> str:
         """Generate channel name using primary instance name."""
         return f"{self.primary_name}-{suffix}"
 
+    def _cache_channels(self) -> None:
+        """Resolve each configured channel ID once so sends skip get_channel()."""
+        self._channels.clear()
+        for key, _, _ in self.CHANNEL_SPECS:
+            channel_id = getattr(self.config.channels, key)
+            if channel_id:
+                channel = self.get_channel(channel_id)
+                if channel:
+                    self._channels[key] = channel
+
     async def on_ready(self):
         print(f"Discord bot connected as {self.user}", flush=True)
         await self.ensure_channels_exist()
+        # on_ready also fires after reconnects, so stale channel objects get replaced here
+        self._cache_channels()
         deleted = await self._cleanup_old_screenshots()
         if deleted > 0:
             print(f"[Discord] Cleaned up {deleted} old screenshots on startup", flush=True)
@@ -116,10 +187,9 @@ class RushdDiscordBot(discord.Client):
         try:
             # Notify start
             await message.add_reaction("🔄")
-            if self.config.channels.status:
-                status_ch = self.get_channel(self.config.channels.status)
-                if status_ch:
-                    await status_ch.send("🔄 Clearing primary instance...")
+            status_ch = self._channels.get("status")
+            if status_ch:
+                await status_ch.send("🔄 Clearing primary instance...")
 
             # Stop the primary instance
             self.manager.stop_instance(self.primary_name, force=True)
@@ -130,9 +200,7 @@ class RushdDiscordBot(discord.Client):
             print(f"[Discord] Removed old primary from store", flush=True)
 
             # Get primary config for recreation
-            from .config import ConfigManager
-            config_mgr = ConfigManager()
-            primary_config = config_mgr.get_primary()
+            primary_config = self.config_manager.get_primary()
 
             # Recreate the instance
             instance = self.manager.start_instance(
@@ -145,19 +213,18 @@ class RushdDiscordBot(discord.Client):
 
             # Clear seen entries
             self.seen_entries.clear()
+            self._seen_previous.clear()
             print(f"[Discord] Cleared seen entries", flush=True)
 
             # Wait for new instance to fully initialize
             await asyncio.sleep(3)
 
-            # Mark a large number of entries as seen to catch ALL old messages
+            # Skip everything already logged instead of marking old entries seen one by one
             try:
-                entries = self.manager.get_activity(self.primary_name, last_n=500)
-                for entry in entries:
-                    self.seen_entries.add(hash_entry(entry))
-                print(f"[Discord] Marked {len(self.seen_entries)} entries as seen after clear", flush=True)
+                self._log_cursor = self.manager.get_activity_cursor(self.primary_name)
+                print(f"[Discord] Moved log cursor to end of session after clear", flush=True)
             except Exception as e:
-                print(f"[Discord] Error marking entries after clear: {e}", flush=True)
+                print(f"[Discord] Error moving log cursor after clear: {e}", flush=True)
 
             # Resume monitor loop
             self._clearing = False
@@ -166,10 +233,9 @@ class RushdDiscordBot(discord.Client):
             # Notify completion
             await message.remove_reaction("🔄", self.user)
             await message.add_reaction("✅")
-            if self.config.channels.status:
-                status_ch = self.get_channel(self.config.channels.status)
-                if status_ch:
-                    await status_ch.send("✅ Primary instance cleared and recreated!")
+            status_ch = self._channels.get("status")
+            if status_ch:
+                await status_ch.send("✅ Primary instance cleared and recreated!")
 
         except Exception as e:
             self._clearing = False  # Resume monitor even on error
@@ -184,8 +250,9 @@ class RushdDiscordBot(discord.Client):
             self.manager.refresh_statuses()
             entries = self.manager.get_activity(self.primary_name, last_n=300)
             for entry in entries:
-                self.seen_entries.add(hash_entry(entry))
-            print(f"Initialized {len(self.seen_entries)} existing entries as seen", flush=True)
+                self._mark_seen(entry.dedupe_key)
+            print(f"Initialized {self._seen_count()} existing entries as seen", flush=True)
+            self._log_cursor = self.manager.get_activity_cursor(self.primary_name)
         except Exception as e:
             import traceback
             print(f"Error initializing seen entries: {e}", flush=True)
@@ -211,7 +278,7 @@ class RushdDiscordBot(discord.Client):
 
         # Check/create each channel
         channels_updated = False
-        for key, suffix in self.CHANNEL_SUFFIXES.items():
+        for key, suffix, topic in self.CHANNEL_SPECS:
             channel_name = self._get_channel_name(suffix)
             current_id = getattr(self.config.channels, key)
 
@@ -234,7 +301,7 @@ class RushdDiscordBot(discord.Client):
             new_channel = await guild.create_text_channel(
                 channel_name,
                 category=category,
-                topic=self._get_channel_topic(key),
+                topic=topic,
             )
             setattr(self.config.channels, key, new_channel.id)
             channels_updated = True
@@ -246,26 +313,20 @@ class RushdDiscordBot(discord.Client):
             self.config_manager.save(full_config)
             print("Channel IDs saved to config")
 
-    def _get_channel_topic(self, channel_key: str) -> str:
-        topics = {
-            "activity": "Full activity stream from Claude (thinking, tools, results)",
-            "responses": "Claude's text responses only",
-            "status": "Status notifications (working, idle, done)",
-            "commands": "Send commands to Claude here",
-            "live_view": "Live view of Claude's activity (auto-updating)",
-        }
-        return topics.get(channel_key, "rushd channel")
-
     async def update_live_view(self):
         """Update the live view message with current activity."""
-        if not self.config.channels.live_view:
-            return
-        channel = self.get_channel(self.config.channels.live_view)
+        channel = self._channels.get("live_view")
         if not channel:
             return
 
         # Get formatted activity
         output = self.manager.get_activity_formatted(self.primary_name, last_n=30)
+
+        # Editing with identical content is still a fetch plus a PATCH, so skip it. An
+        # unchanged log returns the very same string, so this is an identity check
+        # before any message is built
+        if self._live_view_message_id and output == self._live_view_output:
+            return
         content = f"```\n{output[:1900]}\n```"
 
         try:
@@ -283,6 +344,8 @@ class RushdDiscordBot(discord.Client):
             self._live_view_message_id = msg.id
         except Exception as e:
             print(f"[LiveView] Error updating live view: {e}", flush=True)
+            return
+        self._live_view_output = output
 
     async def monitor_primary(self):
         """Poll primary instance and dispatch to appropriate channels."""
@@ -297,38 +360,47 @@ class RushdDiscordBot(discord.Client):
 
                 poll_count += 1
 
-                # Refresh instance statuses to get current state
-                self.manager.refresh_statuses()
-
-                # Debug: check why is_primary_running might fail
-                inst = self.manager.get_instance(self.primary_name)
-                if inst:
-                    tmux_exists = self.manager.tmux.window_exists(inst.tmux_window)
-                    if poll_count % 15 == 0:
-                        print(f"[Monitor] Instance found: status={inst.status}, tmux_window={inst.tmux_window}, tmux_exists={tmux_exists}", flush=True)
-                else:
-                    if poll_count % 15 == 0:
-                        print(f"[Monitor] No instance found for '{self.primary_name}'", flush=True)
-
-                is_running = self.manager.is_primary_running(self.primary_name)
+                # Refresh instance statuses to get current state; the window snapshot it
+                # took saves the tmux calls the checks below would otherwise make
+                live_windows = self.manager.refresh_statuses()
+
+                # Look the primary up once per poll and pass the instance to the manager calls below
+                primary = self.manager.get_instance(self.primary_name)
+
+                # Debug: check why is_primary_running might fail (costs a tmux call, so gated)
+                if poll_count % 15 == 0 and logger.isEnabledFor(logging.DEBUG):
+                    if primary:
+                        tmux_exists = self.manager.tmux.window_exists(primary.tmux_window)
+                        logger.debug(
+                            "[Monitor] Instance found: status=%s, tmux_window=%s, tmux_exists=%s",
+                            primary.status, primary.tmux_window, tmux_exists,
+                        )
+                    else:
+                        logger.debug("[Monitor] No instance found for '%s'", self.primary_name)
+
+                is_running = primary is not None and self.manager.is_primary_running(primary, live_windows)
                 if not is_running:
                     if poll_count % 30 == 0:  # Log every 60 seconds (30 * 2s)
-                        print(f"[Monitor] Primary not running (is_running={is_running}), waiting...", flush=True)
+                        logger.debug("[Monitor] Primary not running, waiting...")
                     await asyncio.sleep(self.config.poll_interval)
                     continue
 
-                entries = self.manager.get_activity(self.primary_name, last_n=200)
+                # Only lines appended since the last poll; seen_entries still guards
+                # against replays when the latest session switches
+                entries, self._log_cursor = self.manager.get_activity_since(primary, self._log_cursor)
                 if poll_count % 15 == 0:  # Log every 30 seconds
-                    print(f"[Monitor] Poll #{poll_count}: {len(entries)} entries, {len(self.seen_entries)} seen", flush=True)
-                activity_state = self.manager.get_activity_state(self.primary_name)
+                    logger.debug("[Monitor] Poll #%d: %d new entries, %d seen", poll_count, len(entries), self._seen_count())
+                activity_state = self.manager.get_activity_state(primary, live_windows)
 
                 for entry in entries:
-                    entry_hash = hash_entry(entry)
-                    if entry_hash in self.seen_entries:
+                    if self._is_seen(entry.dedupe_key):
                         continue
-                    self.seen_entries.add(entry_hash)
+                    self._mark_seen(entry.dedupe_key)
 
-                    print(f"[Monitor] New entry: type={entry.type}, tool={entry.tool_name}, has_text={bool(entry.text_response)}, has_thinking={bool(entry.thinking)}", flush=True)
+                    logger.debug(
+                        "[Monitor] New entry: type=%s, tool=%s, has_text=%s, has_thinking=%s",
+                        entry.type, entry.tool_name, bool(entry.text_response), bool(entry.thinking),
+                    )
 
                     await self.send_to_activity(entry)
 
@@ -361,42 +433,58 @@ class RushdDiscordBot(discord.Client):
                     await self.update_live_view()
                     self._last_live_view_update = now
 
+                # A clean poll ends any run of repeated errors
+                self._last_error = None
+
             except Exception as e:
-                print(f"Monitor error: {e}", flush=True)
-                import traceback
-                traceback.print_exc()
+                self._report_monitor_error(e)
 
             await asyncio.sleep(self.config.poll_interval)
 
+    def _report_monitor_error(self, error: Exception) -> None:
+        """Print a monitor error, throttling identical errors raised on consecutive polls."""
+        signature = (type(error), str(error))
+        if signature == self._last_error:
+            self._error_repeats += 1
+            if self._error_repeats % self.ERROR_REPEAT_INTERVAL == 0:
+                print(f"Monitor error (repeated {self._error_repeats}x): {error}", flush=True)
+            return
+        self._last_error = signature
+        self._error_repeats = 1
+        print(f"Monitor error: {error}", flush=True)
+        import traceback
+        traceback.print_exc()
+
     async def send_to_activity(self, entry: LogEntry):
         """Send formatted activity to activity channel."""
-        if not self.config.channels.activity:
-            print(f"[Send] No activity channel configured", flush=True)
-            return
-        channel = self.get_channel(self.config.channels.activity)
+        channel = self._channels.get("activity")
         if not channel:
-            print(f"[Send] Could not get activity channel {self.config.channels.activity}", flush=True)
+            # Only the failure path goes back to the config to explain why
+            channel_id = self.config.channels.activity
+            if not channel_id:
+                print(f"[Send] No activity channel configured", flush=True)
+            else:
+                print(f"[Send] Could not get activity channel {channel_id}", flush=True)
             return
 
-        sent_count = 0
+        # Each part is a self-contained message; pack them so one entry costs
+        # as few channel.send() round-trips as the 2000-char limit allows
+        parts: list[str] = []
         try:
             if entry.thinking:
                 for chunk in split_message(entry.thinking, 1500):
-                    await channel.send(f"🤔 *thinking...*\n```\n{chunk}\n```")
-                    sent_count += 1
+                    parts.append(f"🤔 *thinking...*\n```\n{chunk}\n```")
             if entry.tool_name:
                 msg = f"🔧 **{entry.tool_name}**"
                 if entry.tool_input:
                     tool_input_str = str(entry.tool_input)
                     for i, chunk in enumerate(split_message(tool_input_str, 500)):
                         if i == 0:
-                            await channel.send(f"{msg}\n```json\n{chunk}\n```")
+                            parts.append(f"{msg}\n```json\n{chunk}\n```")
                         else:
-                            await channel.send(f"```json\n{chunk}\n```")
-                        sent_count += 1
+                            parts.append(f"```json\n{chunk}\n```")
                 else:
-                    await channel.send(msg)
-                    sent_count += 1
+                    parts.append(msg)
 
                 # Special handling for tools that need user input
                 if entry.tool_name == "ExitPlanMode":
@@ -407,22 +495,22 @@ class RushdDiscordBot(discord.Client):
                     await self._notify_question_asked(entry.tool_input)
             if entry.tool_result:
                 for chunk in split_message(entry.tool_result, 1500):
-                    await channel.send(f"📋 Result:\n```\n{chunk}\n```")
-                    sent_count += 1
+                    parts.append(f"📋 Result:\n```\n{chunk}\n```")
             if entry.text_response:
                 for chunk in split_message(entry.text_response, 1900):
-                    await channel.send(f"💬 {chunk}")
-                    sent_count += 1
-            if sent_count > 0:
-                print(f"[Send] Sent {sent_count} messages to activity channel", flush=True)
+                    parts.append(f"💬 {chunk}")
+
+            messages = pack_messages(parts, 2000)
+            for content in messages:
+                await channel.send(content)
+            if messages:
+                logger.debug("[Send] Sent %d messages to activity channel", len(messages))
         except Exception as e:
             print(f"[Send] Error sending to activity: {e}", flush=True)
 
     async def _notify_plan_approval_needed(self):
         """Notify user that Claude is waiting for plan approval."""
-        if not self.config.channels.responses:
-            return
-        channel = self.get_channel(self.config.channels.responses)
+        channel = self._channels.get("responses")
         if not channel:
             return
         try:
@@ -431,19 +519,18 @@ class RushdDiscordBot(discord.Client):
                 "Claude has finished planning and is waiting for your approval.\n"
                 "Reply with `yes`/`approve` to proceed, or provide feedback to modify the plan."
             )
-            print(f"[Send] Sent plan approval notification", flush=True)
+            logger.debug("[Send] Sent plan approval notification")
         except Exception as e:
             print(f"[Send] Error sending plan notification: {e}", flush=True)
 
     async def _notify_question_asked(self, tool_input: dict | None):
         """Notify user that Claude is asking a question."""
-        if not self.config.channels.responses:
-            return
-        channel = self.get_channel(self.config.channels.responses)
+        channel = self._channels.get("responses")
         if not channel:
             return
         try:
-            msg = "❓ **Claude is asking a question**\n"
+            # Collect lines and join once rather than growing a string per option
+            lines = ["❓ **Claude is asking a question**\n"]
             if tool_input and isinstance(tool_input, dict):
                 questions = tool_input.get("questions", [])
                 for q in questions:
@@ -451,15 +538,15 @@ class RushdDiscordBot(discord.Client):
                         question_text = q.get("question", "")
                         options = q.get("options", [])
                         if question_text:
-                            msg += f"\n**{question_text}**\n"
+                            lines.append(f"\n**{question_text}**\n")
                         for i, opt in enumerate(options, 1):
                             if isinstance(opt, dict):
                                 label = opt.get("label", f"Option {i}")
                                 desc = opt.get("description", "")
-                                msg += f"{i}. **{label}** - {desc}\n"
-                msg += "\nReply with your choice (number or text)."
-            await channel.send(truncate(msg, 1900))
-            print(f"[Send] Sent question notification", flush=True)
+                                lines.append(f"{i}. **{label}** - {desc}\n")
+                lines.append("\nReply with your choice (number or text).")
+            await channel.send(truncate("".join(lines), 1900))
+            logger.debug("[Send] Sent question notification")
         except Exception as e:
             print(f"[Send] Error sending question notification: {e}", flush=True)
 
@@ -468,26 +555,27 @@ class RushdDiscordBot(discord.Client):
         # Store response locally for CLI retrieval
         self._store_response(text)
 
-        if not self.config.channels.responses:
-            print(f"[Send] No responses channel configured", flush=True)
-            return
-        channel = self.get_channel(self.config.channels.responses)
+        channel = self._channels.get("responses")
         if not channel:
-            print(f"[Send] Could not get responses channel {self.config.channels.responses}", flush=True)
+            # Only the failure path goes back to the config to explain why
+            channel_id = self.config.channels.responses
+            if not channel_id:
+                print(f"[Send] No responses channel configured", flush=True)
+            else:
+                print(f"[Send] Could not get responses channel {channel_id}", flush=True)
             return
         try:
             chunks = split_message(text, 1900)
             for chunk in chunks:
                 await channel.send(chunk)
-            print(f"[Send] Sent response to responses channel ({len(chunks)} chunks)", flush=True)
+            logger.debug("[Send] Sent response to responses channel (%d chunks)", len(chunks))
         except Exception as e:
             print(f"[Send] Error sending to responses: {e}", flush=True)
 
     def _store_response(self, text: str) -> None:
         """Store response locally for CLI retrieval via `rushd responses`."""
         try:
-            responses_dir = Path.home() / ".rushd" / "responses"
-            responses_dir.mkdir(parents=True, exist_ok=True)
+            RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
 
             timestamp = datetime.now().isoformat()
             filename = f"{int(time.time() * 1000)}.json"
@@ -498,48 +586,72 @@ class RushdDiscordBot(discord.Client):
                 "primary": self.primary_name,
             }
 
-            (responses_dir / filename).write_text(json.dumps(data))
+            (RESPONSES_DIR / filename).write_bytes(jsonutil.dumps(data))
         except Exception as e:
             print(f"[Store] Error storing response: {e}", flush=True)
 
     async def send_status_update(self, status: str, activity: ActivityState):
         """Send status change notification."""
-        if not self.config.channels.status:
-            return
-        channel = self.get_channel(self.config.channels.status)
+        channel = self._channels.get("status")
         if not channel:
             return
 
-        status_messages = {
-            "thinking": "🤔 Claude is thinking...",
-            "tool_use": f"🔧 Claude is using **{activity.tool_name or 'a tool'}**",
-            "running": "⚡ Claude is working...",
-            "idle": f"💤 Claude is idle ({activity.seconds_since_activity:.0f}s)",
-            "unknown": "❓ Status unknown",
-        }
-        await channel.send(status_messages.get(status, f"Status: {status}"))
+        # Only format the message for the status being reported
+        if status == "tool_use":
+            text = f"🔧 Claude is using **{activity.tool_name or 'a tool'}**"
+        elif status == "idle":
+            text = f"💤 Claude is idle ({activity.seconds_since_activity:.0f}s)"
+        else:
+            text = self.STATUS_MESSAGES.get(status, f"Status: {status}")
+        await channel.send(text)
+
+    def _post_status_later(self, text: str) -> None:
+        """Post to the status channel in a background task."""
+        status_ch = self._channels.get("status")
+        if not status_ch:
+            return
+
+        # Hold a reference until done so the task is not garbage collected mid-send
+        task = asyncio.create_task(status_ch.send(text))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+
+    def _background_task_done(self, task: asyncio.Task) -> None:
+        """Drop a finished background task and report its exception, if any."""
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            print(f"[Send] Error sending status message: {exc}", flush=True)
 
     async def _cleanup_old_screenshots(self) -> int:
         """Delete screenshots older than retention period."""
         retention_days = self.config.screenshot_retention_days
         cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
-        deleted_count = 0
+        # The stat/unlink sweep is blocking I/O; run it off the event loop
+        deleted_count = await asyncio.to_thread(self._delete_screenshots_before, cutoff_time)
 
-        if not self.SCREENSHOT_DIR.exists():
-            return 0
+        if deleted_count > 0:
+            print(f"[Cleanup] Deleted {deleted_count} screenshots older than {retention_days} days", flush=True)
+        return deleted_count
 
-        for filepath in self.SCREENSHOT_DIR.iterdir():
-            if filepath.is_file():
+    def _delete_screenshots_before(self, cutoff_time: float) -> int:
+        """Delete screenshots last modified before cutoff_time; returns how many were deleted."""
+        deleted_count = 0
+        try:
+            it = os.scandir(self.SCREENSHOT_DIR)
+        except FileNotFoundError:
+            return 0
+        with it:
+            for dir_entry in it:
                 try:
-                    if filepath.stat().st_mtime < cutoff_time:
-                        filepath.unlink()
+                    if dir_entry.is_file() and dir_entry.stat().st_mtime < cutoff_time:
+                        os.unlink(dir_entry.path)
                         deleted_count += 1
-                        print(f"[Cleanup] Deleted old screenshot: {filepath.name}", flush=True)
+                        print(f"[Cleanup] Deleted old screenshot: {dir_entry.name}", flush=True)
                 except Exception as e:
-                    print(f"[Cleanup] Error deleting {filepath}: {e}", flush=True)
-
-        if deleted_count > 0:
-            print(f"[Cleanup] Deleted {deleted_count} screenshots older than {retention_days} days", flush=True)
+                    print(f"[Cleanup] Error deleting {dir_entry.path}: {e}", flush=True)
         return deleted_count
 
     async def _auto_start_primary(self) -> bool:
@@ -563,10 +675,9 @@ class RushdDiscordBot(discord.Client):
             await asyncio.sleep(3)
 
             # Send status notification
-            if self.config.channels.status:
-                status_ch = self.get_channel(self.config.channels.status)
-                if status_ch:
-                    await status_ch.send("🚀 Auto-started primary instance")
+            status_ch = self._channels.get("status")
+            if status_ch:
+                await status_ch.send("🚀 Auto-started primary instance")
 
             return True
         except Exception as e:
@@ -599,8 +710,8 @@ class RushdDiscordBot(discord.Client):
             return
 
         # Accept commands from both commands and responses channels
-        allowed_channels = [self.config.channels.commands, self.config.channels.responses]
-        if message.channel.id not in allowed_channels:
+        channels = self.config.channels
+        if message.channel.id not in (channels.commands, channels.responses):
             return
 
         if message.author.name not in self.config.allowed_users:
@@ -638,24 +749,25 @@ class RushdDiscordBot(discord.Client):
                 content = paths_text
             print(f"[Discord] Message includes {len(attachment_paths)} screenshot(s)", flush=True)
 
+        lowered = content.lower()
+
         # Handle /clear command - destroy and recreate primary instance
-        if content.lower() == "/clear":
+        if lowered == "/clear":
             await self._handle_clear_command(message)
             return
 
         # If awaiting plan approval, distinguish approval from feedback
         if self._awaiting_plan_approval:
-            if content.lower() in self.APPROVAL_KEYWORDS:
+            if lowered in self.APPROVAL_KEYWORDS:
                 # Approval - press "2" to select approve option
                 print(f"[Discord] Detected plan approval keyword: {content}", flush=True)
                 success = self.manager.send_key(self.primary_name, "2")
             else:
                 # Feedback - navigate to modify option (Down×3), then send text
                 print(f"[Discord] Detected plan feedback, navigating to modify option", flush=True)
-                for _ in range(3):
-                    self.manager.send_key(self.primary_name, "Down")
-                    await asyncio.sleep(0.1)
-                await asyncio.sleep(0.2)
+                # tmux delivers the keys in order, so only a short settle before typing is needed
+                self.manager.send_key(self.primary_name, "Down", count=3)
+                await asyncio.sleep(self.FEEDBACK_SETTLE_SECONDS)
                 # Send the feedback text
                 success = self.manager.send_message(self.primary_name, content)
         else:
@@ -663,12 +775,8 @@ class RushdDiscordBot(discord.Client):
 
         if success:
             await message.add_reaction("✅")
-            if self.config.channels.status:
-                status_ch = self.get_channel(self.config.channels.status)
-                if status_ch:
-                    await status_ch.send(
-                        f"📨 Received command from {message.author.name}"
-                    )
+            # The reaction is the ack; the status post need not hold up the next message
+            self._post_status_later(f"📨 Received command from {message.author.name}")
         else:
             await message.add_reaction("❌")
             await message.reply(
@@ -683,6 +791,14 @@ def run_discord_bot(
     primary_name: str,
     token: str,
 ):
-    """Run the Discord bot (blocking)."""
+    """Run the Discord bot (blocking).
+
+    Per-poll and per-send diagnostics are logged at DEBUG; set RUSHD_DEBUG=1 to show them.
+    """
+    if os.environ.get("RUSHD_DEBUG"):
+        # Only the rushd loggers; discord.py sets up its own handler in bot.run()
+        rushd_logger = logging.getLogger("rushd")
+        rushd_logger.setLevel(logging.DEBUG)
+        rushd_logger.addHandler(logging.StreamHandler())
     bot = RushdDiscordBot(manager, config, config_manager, primary_name)
     bot.run(token)
@@ -0,0 +1,30 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (the "fast" extra)
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize (unknown types are converted with str())
+        indent: Pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=str)
+    if indent:
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False).encode()
+
+
+# loads(data: bytes | str) -> Any parses JSON and raises ValueError on invalid input.
+# Bound straight to the parser rather than wrapped: session logs call it once per line.
+loads: Callable[[Union[bytes, str]], Any] = orjson.loads if orjson is not None else json.loads
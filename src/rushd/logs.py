@@ -1,13 +1,64 @@
 """Read and parse Claude Code conversation logs."""
 
-import json
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal, Optional
-
-
-@dataclass
+from typing import BinaryIO, Literal, Optional
+
+from . import jsonutil
+
+# Claude Code writes these record types with "type" as the first key; matching the
+# raw prefix skips JSON-decoding lines _parse_entry would discard anyway
+_SKIPPED_LINE_PREFIXES = (b'{"type":"file-history-snapshot"', b'{"type":"summary"')
+
+# Guards ClaudeLogReader._entry_cache: the TUI reads logs from its poll worker
+# and its UI thread at once, and an eviction between another thread's get and
+# move_to_end would raise KeyError there
+_entry_cache_lock = threading.Lock()
+
+
+def _tail_lines(path: Path, n: int) -> list[bytes]:
+    """Return the last n lines of a file, scanning a read-only mmap backwards from the end."""
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A trailing newline ends the last line rather than starting an empty one
+            end = size - 1 if mm[size - 1] == 0x0A else size
+            lines: list[bytes] = []
+            while end > 0 and len(lines) < n:
+                start = mm.rfind(b"\n", 0, end) + 1
+                lines.append(mm[start:end])
+                end = start - 1
+            # Only an empty first line is left when the scan stops at offset 0 on a newline
+            if end == 0 and len(lines) < n:
+                lines.append(b"")
+    lines.reverse()
+    return lines
+
+
+def _tail_start(f: BinaryIO, size: int, n: int) -> int:
+    """Offset at which the last n lines of an open file's first size bytes begin."""
+    if n <= 0 or size == 0:
+        return size
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = size - 1 if mm[size - 1] == 0x0A else size
+        for _ in range(n):
+            end = mm.rfind(b"\n", 0, end)
+            if end < 0:
+                return 0
+        return end + 1
+
+
+@dataclass(slots=True)
 class ActivityState:
     """Current activity state derived from log analysis."""
 
@@ -16,7 +67,7 @@ class ActivityState:
     seconds_since_activity: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Parsed log entry from Claude Code conversation."""
 
@@ -27,18 +78,52 @@ class LogEntry:
     # Extracted fields
     thinking: Optional[str] = None
     tool_name: Optional[str] = None
-    tool_input: Optional[dict] = field(default_factory=dict)
+    tool_input: Optional[dict] = None
     tool_result: Optional[str] = None
     is_error: bool = False
     text_response: Optional[str] = None
     user_message: Optional[str] = None
 
+    # In-process key identifying this entry, from its UUID when it has one; set once
+    # by the parser after the type handler has filled in tool_name
+    dedupe_key: int = field(default=0, repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class LogCursor:
+    """Position just past the last complete line consumed from a session log."""
+
+    session_path: Optional[Path] = None
+    offset: int = 0
+
 
 class ClaudeLogReader:
     """Read and parse Claude Code conversation logs."""
 
     CLAUDE_DIR = Path.home() / ".claude"
 
+    # Parsed entries shared by every reader in the process, since the manager
+    # builds a new reader per call: (session path, uuid) -> entry
+    _entry_cache: OrderedDict[tuple[Path, str], LogEntry] = OrderedDict()
+    ENTRY_CACHE_LIMIT = 1024
+
+    # Latest session per project dir: dir -> (dir st_mtime_ns, monotonic check time, path)
+    _latest_cache: dict[Path, tuple[int, float, Optional[Path]]] = {}
+    # A new session file bumps the dir mtime, but an older session being resumed does
+    # not, so cached answers are also re-checked after this many seconds
+    LATEST_SESSION_TTL = 10.0
+
+    # Lines read_entries_since reads from a session it has no position in yet, so a
+    # switch to a long existing session does not replay its whole history
+    SESSION_SWITCH_LINES = 200
+
+    # Newest entry per session log, keyed by what the file looked like when it was read:
+    # session path -> ((st_size, st_mtime_ns, lookback), entry). Logs are append-only, so
+    # any new line changes the size.
+    _latest_entry_cache: dict[Path, tuple[tuple[int, int, int], Optional[LogEntry]]] = {}
+    # Same idea for read_entries: session path -> ((st_size, st_mtime_ns, last_n), entries)
+    _entries_cache: dict[Path, tuple[tuple[int, int, int], list[LogEntry]]] = {}
+
     def __init__(self, working_dir: Path):
         self.working_dir = Path(working_dir).resolve()
         self.project_dir = self._get_project_dir()
@@ -50,9 +135,18 @@ class ClaudeLogReader:
         return self.CLAUDE_DIR / "projects" / encoded
 
     def find_latest_session(self) -> Optional[Path]:
-        """Find the most recent session log file."""
-        if not self.project_dir.exists():
+        """Find the most recent session log file.
+
+        The answer is cached until the project dir's mtime changes or LATEST_SESSION_TTL passes.
+        """
+        try:
+            dir_mtime = self.project_dir.stat().st_mtime_ns
+        except OSError:
             return None
+        now = time.monotonic()
+        cached = self._latest_cache.get(self.project_dir)
+        if cached is not None and cached[0] == dir_mtime and now - cached[1] < self.LATEST_SESSION_TTL:
+            return cached[2]
 
         # Get all .jsonl files that look like session IDs (UUID format)
         logs = [
@@ -60,10 +154,9 @@ class ClaudeLogReader:
             if len(p.stem) == 36 and "-" in p.stem  # UUID format
         ]
 
-        if not logs:
-            return None
-
-        return max(logs, key=lambda p: p.stat().st_mtime)
+        latest = max(logs, key=lambda p: p.stat().st_mtime) if logs else None
+        self._latest_cache[self.project_dir] = (dir_mtime, now, latest)
+        return latest
 
     def get_session_id(self) -> Optional[str]:
         """Get the session ID of the latest session."""
@@ -73,33 +166,155 @@ class ClaudeLogReader:
         return None
 
     def read_entries(self, session_path: Optional[Path] = None, last_n: int = 50) -> list[LogEntry]:
-        """Read the last N entries from a session log."""
+        """Read the last N entries from a session log.
+
+        While the log is unchanged the same list object is returned again, so callers
+        can detect "nothing new" by identity. Treat the list as read-only.
+        """
         if session_path is None:
             session_path = self.find_latest_session()
 
-        if session_path is None or not session_path.exists():
+        if session_path is None:
+            return []
+
+        # A missing file surfaces as OSError here, so no exists() stat first
+        try:
+            st = session_path.stat()
+        except OSError:
+            return []
+        key = (st.st_size, st.st_mtime_ns, last_n)
+        cached = self._entries_cache.get(session_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            lines = _tail_lines(session_path, last_n)
+        except OSError:
             return []
 
         entries = []
+        for line in lines:
+            entry = self._parse_line(session_path, line)
+            if entry:
+                entries.append(entry)
+        self._entries_cache[session_path] = (key, entries)
+        return entries
+
+    def read_latest_entry(self, lookback: int = 5) -> Optional[LogEntry]:
+        """
+        Return the newest entry in the latest session.
+
+        Lines are parsed from the end and the scan stops at the first entry, so
+        trailing snapshot/summary or malformed lines (up to lookback) are skipped
+        without parsing everything before them.
+        """
+        session_path = self.find_latest_session()
+        if session_path is None:
+            return None
+        # Status polls call this far more often than the log grows; one stat() tells
+        # whether the tail read (open, mmap, scan, parse) can be skipped
         try:
-            with open(session_path) as f:
-                lines = f.readlines()
+            st = session_path.stat()
+        except OSError:
+            return None
+        key = (st.st_size, st.st_mtime_ns, lookback)
+        cached = self._latest_entry_cache.get(session_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-            for line in lines[-last_n:]:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    entry = self._parse_entry(data)
-                    if entry:
-                        entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
+        try:
+            lines = _tail_lines(session_path, lookback)
         except IOError:
-            pass
+            return None
+        latest = None
+        for line in reversed(lines):
+            entry = self._parse_line(session_path, line)
+            if entry:
+                latest = entry
+                break
+        self._latest_entry_cache[session_path] = (key, latest)
+        return latest
+
+    def _parse_line(self, session_path: Path, line: bytes) -> Optional[LogEntry]:
+        """Parse one raw JSONL line, or return None for blank, skipped or malformed lines."""
+        line = line.strip()
+        if not line or line.startswith(_SKIPPED_LINE_PREFIXES):
+            return None
+        try:
+            return self._parse_cached(session_path, jsonutil.loads(line))
+        except ValueError:
+            return None
 
-        return entries
+    def end_cursor(self) -> LogCursor:
+        """Cursor at the end of the latest session, so only later lines are read."""
+        session_path = self.find_latest_session()
+        if session_path is None:
+            return LogCursor()
+        try:
+            return LogCursor(session_path, session_path.stat().st_size)
+        except OSError:
+            return LogCursor()
+
+    def read_entries_since(self, cursor: LogCursor) -> tuple[list[LogEntry], LogCursor]:
+        """
+        Read entries appended to the latest session after cursor.
+
+        Args:
+            cursor: Position returned by a previous call or end_cursor()
+
+        Returns:
+            (new entries, cursor to pass next time). A different session, or a
+            log that shrank below the cursor, is read from its last
+            SESSION_SWITCH_LINES lines. A trailing line without a newline is left
+            for the next call.
+        """
+        session_path = self.find_latest_session()
+        if session_path is None:
+            return [], cursor
+
+        entries = []
+        try:
+            with open(session_path, "rb") as f:
+                size = f.seek(0, 2)
+                if session_path == cursor.session_path and cursor.offset <= size:
+                    offset = cursor.offset
+                else:
+                    offset = _tail_start(f, size, self.SESSION_SWITCH_LINES)
+                f.seek(offset)
+                # Iterate rather than read() so a large unread backlog is never held in memory at once
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    entry = self._parse_line(session_path, line)
+                    if entry:
+                        entries.append(entry)
+        except OSError:
+            if not entries:
+                return [], cursor
+
+        return entries, LogCursor(session_path, offset)
+
+    def _parse_cached(self, session_path: Path, data: dict) -> Optional[LogEntry]:
+        """Parse an entry, reusing the earlier result for a line with the same uuid."""
+        uuid = data.get("uuid")
+        if not uuid:
+            return self._parse_entry(data)
+        key = (session_path, uuid)
+        cache = self._entry_cache
+        with _entry_cache_lock:
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+                return entry
+        # Parsed outside the lock; a thread racing on the same line just parses it twice
+        entry = self._parse_entry(data)
+        if entry is not None:
+            with _entry_cache_lock:
+                cache[key] = entry
+                if len(cache) > self.ENTRY_CACHE_LIMIT:
+                    cache.popitem(last=False)
+        return entry
 
     def _parse_entry(self, data: dict) -> Optional[LogEntry]:
         """Parse a raw log entry into structured LogEntry."""
@@ -115,57 +330,67 @@ class ClaudeLogReader:
             uuid=data.get("uuid", ""),
         )
 
-        # Handle user messages
-        if entry_type == "user":
-            message = data.get("message", {})
-            content = message.get("content", "")
-
-            # Simple text message
-            if isinstance(content, str):
-                entry.user_message = content
-
-            # Tool result
-            elif isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "tool_result":
-                        entry.tool_result = str(item.get("content", ""))
-                        entry.is_error = item.get("is_error", False)
-
-                        # Also check toolUseResult for more details
-                        tool_result = data.get("toolUseResult", {})
-                        if tool_result and isinstance(tool_result, dict):
-                            stdout = tool_result.get("stdout", "")
-                            stderr = tool_result.get("stderr", "")
-                            if stderr:
-                                entry.is_error = True
-                                entry.tool_result = stderr
-                            elif stdout:
-                                entry.tool_result = stdout
-
-        # Handle assistant messages
-        elif entry_type == "assistant":
-            message = data.get("message", {})
-            content = message.get("content", [])
-
-            if isinstance(content, list):
-                for item in content:
-                    if not isinstance(item, dict):
-                        continue
-
-                    item_type = item.get("type")
-
-                    if item_type == "thinking":
-                        entry.thinking = item.get("thinking", "")
-
-                    elif item_type == "tool_use":
-                        entry.tool_name = item.get("name")
-                        entry.tool_input = item.get("input", {})
-
-                    elif item_type == "text":
-                        entry.text_response = item.get("text", "")
-
+        handler = self._ENTRY_HANDLERS.get(entry_type)
+        if handler is not None:
+            handler(self, entry, data)
+        entry.dedupe_key = (
+            hash(entry.uuid) if entry.uuid else hash((entry.timestamp, entry.type, entry.tool_name))
+        )
         return entry
 
+    def _parse_user(self, entry: LogEntry, data: dict) -> None:
+        """Fill in a user entry: a plain message or a tool result."""
+        message = data.get("message", {})
+        content = message.get("content", "")
+
+        # Simple text message
+        if isinstance(content, str):
+            entry.user_message = content
+
+        # Tool result
+        elif isinstance(content, list):
+            for item in content:
+                if type(item) is dict and item.get("type") == "tool_result":
+                    entry.tool_result = str(item.get("content", ""))
+                    entry.is_error = item.get("is_error", False)
+
+                    # Also check toolUseResult for more details
+                    tool_result = data.get("toolUseResult", {})
+                    if tool_result and isinstance(tool_result, dict):
+                        stdout = tool_result.get("stdout", "")
+                        stderr = tool_result.get("stderr", "")
+                        if stderr:
+                            entry.is_error = True
+                            entry.tool_result = stderr
+                        elif stdout:
+                            entry.tool_result = stdout
+
+    def _parse_assistant(self, entry: LogEntry, data: dict) -> None:
+        """Fill in an assistant entry's thinking, tool call and text."""
+        message = data.get("message", {})
+        content = message.get("content", [])
+
+        if isinstance(content, list):
+            for item in content:
+                if type(item) is not dict:
+                    continue
+
+                get = item.get
+                item_type = get("type")
+
+                if item_type == "thinking":
+                    entry.thinking = get("thinking", "")
+
+                elif item_type == "tool_use":
+                    entry.tool_name = get("name")
+                    entry.tool_input = get("input", {})
+
+                elif item_type == "text":
+                    entry.text_response = get("text", "")
+
+    # Entry type -> method that fills in the type-specific fields; other types keep only the basics
+    _ENTRY_HANDLERS = {"user": _parse_user, "assistant": _parse_assistant}
+
     def detect_activity_state(self, idle_threshold_seconds: float = 5.0) -> ActivityState:
         """
         Detect the current activity state from the most recent log entries.
@@ -176,19 +401,16 @@ class ClaudeLogReader:
         Returns:
             ActivityState with detected status and metadata
         """
-        entries = self.read_entries(last_n=5)
+        # Only the most recent entry matters, so parse from the end and stop there
+        latest = self.read_latest_entry(lookback=5)
 
-        if not entries:
+        if latest is None:
             return ActivityState(status="unknown")
 
-        # Get the most recent entry
-        latest = entries[-1]
-
         # Parse timestamp to determine age
         try:
-            # Handle ISO format with Z suffix
-            ts = latest.timestamp.replace("Z", "+00:00")
-            entry_time = datetime.fromisoformat(ts)
+            # fromisoformat accepts the trailing "Z" natively on Python 3.11+
+            entry_time = datetime.fromisoformat(latest.timestamp)
             now = datetime.now(timezone.utc)
             seconds_ago = (now - entry_time).total_seconds()
         except (ValueError, AttributeError):
@@ -229,70 +451,61 @@ class ClaudeLogReader:
         )
 
 
+def _clip(text: str, n: int, first_line: bool = False) -> str:
+    """First n chars of text (optionally only its first line), with "..." if text is longer than n."""
+    preview = text[:n]
+    if first_line:
+        # Same as text.split("\n")[0][:n] without splitting the whole text
+        preview = preview.partition("\n")[0]
+    return f"{preview}..." if len(text) > n else preview
+
+
+# Tool name -> (tool_input key shown as the preview, character limit or None)
+_TOOL_PREVIEW: dict[str, tuple[str, Optional[int]]] = {
+    "Read": ("file_path", None),
+    "Glob": ("pattern", None),
+    "Grep": ("pattern", None),
+    "Bash": ("command", 60),
+    "Write": ("file_path", None),
+    "Edit": ("file_path", None),
+}
+
+
 def format_entry(entry: LogEntry) -> Optional[str]:
     """Format a log entry for display."""
     if entry.thinking:
         # Truncate thinking to first line or 100 chars
-        thinking_preview = entry.thinking.split("\n")[0][:100]
-        if len(entry.thinking) > 100:
-            thinking_preview += "..."
-        return f"🤔 {thinking_preview}"
+        return f"🤔 {_clip(entry.thinking, 100, first_line=True)}"
 
     if entry.tool_name:
-        desc = entry.tool_input.get("description", "") if entry.tool_input else ""
+        tool_input = entry.tool_input or {}
+        desc = tool_input.get("description", "")
         if desc:
             return f"🔧 {entry.tool_name}: {desc}"
-        else:
-            # Try to get a useful preview from the input
-            if entry.tool_name == "Read":
-                file_path = entry.tool_input.get("file_path", "") if entry.tool_input else ""
-                return f"🔧 Read: {file_path}"
-            elif entry.tool_name == "Glob":
-                pattern = entry.tool_input.get("pattern", "") if entry.tool_input else ""
-                return f"🔧 Glob: {pattern}"
-            elif entry.tool_name == "Grep":
-                pattern = entry.tool_input.get("pattern", "") if entry.tool_input else ""
-                return f"🔧 Grep: {pattern}"
-            elif entry.tool_name == "Bash":
-                cmd = entry.tool_input.get("command", "") if entry.tool_input else ""
-                return f"🔧 Bash: {cmd[:60]}..."
-            elif entry.tool_name == "Write":
-                file_path = entry.tool_input.get("file_path", "") if entry.tool_input else ""
-                return f"🔧 Write: {file_path}"
-            elif entry.tool_name == "Edit":
-                file_path = entry.tool_input.get("file_path", "") if entry.tool_input else ""
-                return f"🔧 Edit: {file_path}"
-            else:
-                return f"🔧 {entry.tool_name}"
+        # Try to get a useful preview from the input
+        spec = _TOOL_PREVIEW.get(entry.tool_name)
+        if spec is None:
+            return f"🔧 {entry.tool_name}"
+        key, limit = spec
+        value = tool_input.get(key, "")
+        if limit is not None:
+            return f"🔧 {entry.tool_name}: {value[:limit]}..."
+        return f"🔧 {entry.tool_name}: {value}"
 
     if entry.tool_result is not None:
         icon = "✗" if entry.is_error else "✓"
-        result_preview = entry.tool_result.split("\n")[0][:80]
-        if len(entry.tool_result) > 80:
-            result_preview += "..."
-        return f"   {icon} {result_preview}"
+        return f"   {icon} {_clip(entry.tool_result, 80, first_line=True)}"
 
     if entry.text_response:
         # Format as Claude's response
-        response_preview = entry.text_response[:200]
-        if len(entry.text_response) > 200:
-            response_preview += "..."
-        return f"💬 {response_preview}"
+        return f"💬 {_clip(entry.text_response, 200)}"
 
     if entry.user_message:
-        msg_preview = entry.user_message[:100]
-        if len(entry.user_message) > 100:
-            msg_preview += "..."
-        return f"👤 {msg_preview}"
+        return f"👤 {_clip(entry.user_message, 100)}"
 
     return None
 
 
 def format_activity(entries: list[LogEntry]) -> str:
     """Format a list of log entries into a displayable string."""
-    lines = []
-    for entry in entries:
-        formatted = format_entry(entry)
-        if formatted:
-            lines.append(formatted)
-    return "\n".join(lines)
+    return "\n".join(filter(None, map(format_entry, entries)))
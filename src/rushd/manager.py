@@ -1,30 +1,72 @@
 """Main manager for Claude Code instances."""
 
 import logging
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Container, Optional, Union
 
 from .models import InstanceMetadata, InstanceStatus, DisplayMode, Notification, NotificationStatus
-from .notifications import NotificationStore
 from .store import InstanceStore
 from .tmux import TmuxController, PANE_ID_PATTERN
-from .logs import ClaudeLogReader, LogEntry, format_activity, ActivityState
+from .logs import ClaudeLogReader, LogCursor, LogEntry, format_entry, ActivityState
+
+if TYPE_CHECKING:
+    from .notifications import NotificationStore
 
 logger = logging.getLogger(__name__)
 
+# Public methods take an instance ID or name, or an instance the caller already looked up
+InstanceRef = Union[str, InstanceMetadata]
+
+# Activity state detected from logs -> stored instance status
+ACTIVITY_STATUS_MAP = {
+    "thinking": InstanceStatus.THINKING,
+    "tool_use": InstanceStatus.TOOL_USE,
+    "idle": InstanceStatus.IDLE,
+    "running": InstanceStatus.RUNNING,
+    "unknown": InstanceStatus.RUNNING,
+}
+
 
 class ClaudeInstanceManager:
     """Manager for creating, controlling, and monitoring Claude Code instances."""
 
+    # Longest wait for windows to close after Ctrl+C before they are killed
+    GRACEFUL_STOP_TIMEOUT = 1.0
+    # How often to check for closed windows meanwhile (a list-panes over the control client)
+    GRACEFUL_STOP_POLL = 0.05
+
     def __init__(self, session_name: str = "rushd-instances"):
         self.session_name = session_name
         self.store = InstanceStore()
         self.tmux = TmuxController(session_name)
 
         # Notification store (lazy loaded)
-        self._notification_store: Optional[NotificationStore] = None
+        self._notification_store: Optional["NotificationStore"] = None
+
+        # One long-lived log reader per working dir, reused across polls
+        self._log_readers: dict[Path, ClaudeLogReader] = {}
+
+        # Last formatted activity per instance id:
+        # (entries list it was built from, text, id(entry) -> formatted line)
+        self._formatted_activity: dict[
+            str, tuple[list[LogEntry], str, dict[int, Optional[str]]]
+        ] = {}
+
+    def _log_reader_for(self, working_dir: Path) -> ClaudeLogReader:
+        """Get the cached log reader for a working directory, creating it on first use."""
+        reader = self._log_readers.get(working_dir)
+        if reader is None:
+            reader = self._log_readers[working_dir] = ClaudeLogReader(working_dir)
+        return reader
+
+    def _resolve(self, identifier: InstanceRef) -> Optional[InstanceMetadata]:
+        """Look up an instance by ID or name; an already-resolved instance is returned as is."""
+        if isinstance(identifier, InstanceMetadata):
+            return identifier
+        return self.store.find_by_name_or_id(identifier)
 
     def _generate_id(self) -> tuple[str, str]:
         """Generate a new instance ID (short_id, full_id)."""
@@ -39,8 +81,8 @@ class ClaudeInstanceManager:
         resume: Optional[str] = None,
         initial_prompt: Optional[str] = None,
         auto_approve: bool = True
-    ) -> str:
-        """Build the claude command to run."""
+    ) -> list[str]:
+        """Build the claude command to run as an argv list."""
         cmd_parts = ["claude"]
 
         # Auto-approve all prompts by default (trust + permissions)
@@ -54,11 +96,10 @@ class ClaudeInstanceManager:
             cmd_parts.extend(["--resume", resume])
 
         if initial_prompt:
-            # Escape quotes in the prompt
-            escaped = initial_prompt.replace('"', '\\"')
-            cmd_parts.extend(["-p", f'"{escaped}"'])
+            # Passed as its own argument; tmux.create_window quotes it for the shell
+            cmd_parts.extend(["-p", initial_prompt])
 
-        return " ".join(cmd_parts)
+        return cmd_parts
 
     def start_instance(
         self,
@@ -150,27 +191,25 @@ class ClaudeInstanceManager:
             last_activity=datetime.now()
         )
 
-    def stop_instance(self, identifier: str, force: bool = False) -> bool:
+    def stop_instance(self, identifier: InstanceRef, force: bool = False) -> bool:
         """
         Stop a Claude Code instance.
 
         Args:
-            identifier: Instance ID or name
+            identifier: Instance ID or name, or the instance itself
             force: Skip graceful shutdown
 
         Returns:
             True if stopped successfully
         """
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return False
 
         if not force:
             # Try graceful shutdown with Ctrl+C
             self.tmux.send_interrupt(instance.tmux_window)
-            # Wait a bit for graceful exit
-            import time
-            time.sleep(1)
+            self._wait_for_exit([instance])
 
         # Kill the window
         self.tmux.kill_window(instance.tmux_window)
@@ -183,35 +222,63 @@ class ClaudeInstanceManager:
 
         return True
 
+    def _wait_for_exit(self, instances: list[InstanceMetadata]) -> None:
+        """Poll until none of the instances' windows are live, up to GRACEFUL_STOP_TIMEOUT."""
+        targets = {instance.tmux_window for instance in instances}
+        deadline = time.monotonic() + self.GRACEFUL_STOP_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(self.GRACEFUL_STOP_POLL)
+            if targets.isdisjoint(self.tmux.list_all_panes()):
+                return
+
     def stop_all(self, force: bool = False) -> int:
         """Stop all running instances. Returns count of stopped instances."""
         instances = self.store.list_all(include_stopped=False)
-        count = 0
+        if not force and instances:
+            # Interrupt everything first so the graceful wait is shared, not paid per instance
+            for instance in instances:
+                self.tmux.send_interrupt(instance.tmux_window)
+            self._wait_for_exit(instances)
         for instance in instances:
-            if self.stop_instance(instance.id, force=force):
-                count += 1
-        return count
+            self.tmux.kill_window(instance.tmux_window)
+        self.store.update_many({instance.id: {"status": InstanceStatus.STOPPED} for instance in instances})
+        return len(instances)
 
     def list_instances(self, include_stopped: bool = False) -> list[InstanceMetadata]:
         """List all managed instances."""
         instances = self.store.list_all(include_stopped=include_stopped)
 
-        # Sync with actual tmux state
+        # Sync with actual tmux state (one tmux call covers every instance)
+        live_windows = self.tmux.list_all_panes() if instances else {}
+        gone = {
+            instance.id: {"status": InstanceStatus.STOPPED}
+            for instance in instances
+            if instance.status != InstanceStatus.STOPPED and instance.tmux_window not in live_windows
+        }
+        updated = self.store.update_many(gone)
+
+        # Build the result from the updated records instead of re-reading the store
+        result = []
         for instance in instances:
-            if instance.status != InstanceStatus.STOPPED:
-                if not self.tmux.window_exists(instance.tmux_window):
-                    self.store.update(instance.id, status=InstanceStatus.STOPPED)
+            if instance.id in gone:
+                instance = updated.get(instance.id)
+                if instance is None or not include_stopped:
+                    continue
+            result.append(instance)
 
-        return self.store.list_all(include_stopped=include_stopped)
+        return result
 
     def get_instance(self, identifier: str) -> Optional[InstanceMetadata]:
         """Get an instance by ID or name."""
         return self.store.find_by_name_or_id(identifier)
 
-    def remove_instance(self, identifier: str) -> bool:
+    def remove_instance(self, identifier: InstanceRef) -> bool:
         """Remove an instance from storage entirely (does not stop it first)."""
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if instance:
+            # Readers are cheap to recreate, so drop this dir's even if another instance shares it
+            self._log_readers.pop(instance.working_dir, None)
+            self._formatted_activity.pop(instance.id, None)
             return self.store.remove(instance.id)
         return False
 
@@ -219,18 +286,31 @@ class ClaudeInstanceManager:
         """Get the primary instance if it exists."""
         return self.store.find_by_name_or_id(primary_name)
 
-    def is_primary_running(self, primary_name: str = "primary") -> bool:
-        """Check if the primary instance exists and is running."""
-        inst = self.get_primary_instance(primary_name)
+    def _window_live(self, window_target: str, live_windows: Optional[Container[str]]) -> bool:
+        """Check a window against a refresh_statuses() snapshot, or ask tmux when there is none."""
+        if live_windows is not None:
+            return window_target in live_windows
+        return self.tmux.window_exists(window_target)
+
+    def is_primary_running(
+        self,
+        primary_name: InstanceRef = "primary",
+        live_windows: Optional[Container[str]] = None,
+    ) -> bool:
+        """Check if the primary instance exists and is running.
+
+        live_windows is a snapshot from refresh_statuses(); passing it skips the tmux call.
+        """
+        inst = self._resolve(primary_name)
         if not inst:
             return False
         if inst.status == InstanceStatus.STOPPED:
             return False
-        return self.tmux.window_exists(inst.tmux_window)
+        return self._window_live(inst.tmux_window, live_windows)
 
-    def send_message(self, identifier: str, message: str) -> bool:
+    def send_message(self, identifier: InstanceRef, message: str) -> bool:
         """Send a message to an instance."""
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return False
 
@@ -239,29 +319,29 @@ class ClaudeInstanceManager:
             self.store.update(instance.id, last_activity=datetime.now())
         return success
 
-    def send_key(self, identifier: str, key: str) -> bool:
-        """Send a special key to an instance (e.g., 'Down', 'Up', 'Escape', '2')."""
-        instance = self.store.find_by_name_or_id(identifier)
+    def send_key(self, identifier: InstanceRef, key: str, count: int = 1) -> bool:
+        """Send a special key to an instance (e.g., 'Down', 'Up', 'Escape', '2'), count times."""
+        instance = self._resolve(identifier)
         if not instance:
             return False
-        return self.tmux.send_keys(instance.tmux_window, key, enter=False)
+        return self.tmux.send_key_sequence(instance.tmux_window, [key] * count)
 
-    def capture_output(self, identifier: str, lines: int = 500) -> str:
+    def capture_output(self, identifier: InstanceRef, lines: int = 500) -> str:
         """Capture recent output from an instance."""
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return ""
 
         return self.tmux.capture_pane(instance.tmux_window, lines=lines)
 
-    def attach(self, identifier: str) -> bool:
+    def attach(self, identifier: InstanceRef) -> bool:
         """
         Attach to an instance's tmux window.
 
         This hands control to tmux and blocks until detached.
         If already inside tmux, uses switch-client instead of attach-session.
         """
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return False
 
@@ -274,53 +354,67 @@ class ClaudeInstanceManager:
         self.stop_all(force=force)
         self.tmux.cleanup_session()
         self.store.clear_all()
+        self.store.close()
+        self._log_readers.clear()
 
-    def get_activity_state(self, identifier: str) -> ActivityState:
+    def get_activity_state(
+        self,
+        identifier: InstanceRef,
+        live_windows: Optional[Container[str]] = None,
+    ) -> ActivityState:
         """
         Get the current activity state of an instance.
 
         Args:
-            identifier: Instance ID or name
+            identifier: Instance ID or name, or the instance itself
+            live_windows: Snapshot from refresh_statuses(); skips the tmux window check
 
         Returns:
             ActivityState with current status
         """
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return ActivityState(status="unknown")
 
-        if not self.tmux.window_exists(instance.tmux_window):
+        if not self._window_live(instance.tmux_window, live_windows):
             return ActivityState(status="unknown")
 
-        log_reader = ClaudeLogReader(instance.working_dir)
-        return log_reader.detect_activity_state()
+        return self._log_reader_for(instance.working_dir).detect_activity_state()
 
-    def refresh_statuses(self) -> None:
-        """Refresh the status of all instances based on tmux state and activity."""
+    def refresh_statuses(self) -> dict[str, dict]:
+        """
+        Refresh the status of all instances based on tmux state and activity.
+
+        Returns the live panes snapshot (keyed by window target) it checked against,
+        so callers can test windows right after a refresh without another tmux call.
+        """
         instances = self.store.list_all(include_stopped=True)
+        # One tmux call covers every instance instead of one per window
+        live_windows = self.tmux.list_all_panes()
+        # One clock read per refresh; every instance in it is stamped with the same time
+        now = datetime.now()
+        # Collected per instance and written with a single store load and save
+        all_updates: dict[str, dict] = {}
         for instance in instances:
-            window_exists = self.tmux.window_exists(instance.tmux_window)
+            window_exists = instance.tmux_window in live_windows
 
             if not window_exists:
                 # Window gone - mark as stopped
                 if instance.status != InstanceStatus.STOPPED:
-                    self.store.update(instance.id, status=InstanceStatus.STOPPED)
+                    all_updates[instance.id] = {
+                        "status": InstanceStatus.STOPPED,
+                        "last_refreshed": now,
+                    }
             else:
                 # Window exists - detect activity state from logs
-                activity = self.get_activity_state(instance.id)
-                status_map = {
-                    "thinking": InstanceStatus.THINKING,
-                    "tool_use": InstanceStatus.TOOL_USE,
-                    "idle": InstanceStatus.IDLE,
-                    "running": InstanceStatus.RUNNING,
-                    "unknown": InstanceStatus.RUNNING,
-                }
-                new_status = status_map.get(activity.status, InstanceStatus.RUNNING)
+                activity = self._log_reader_for(instance.working_dir).detect_activity_state()
+                new_status = ACTIVITY_STATUS_MAP.get(activity.status, InstanceStatus.RUNNING)
 
                 # Build updates dict
                 updates: dict = {
                     "status": new_status,
-                    "last_activity": datetime.now(),
+                    "last_activity": now,
+                    "last_refreshed": now,
                 }
 
                 # Idle tracking for workers only (not primary)
@@ -331,12 +425,12 @@ class ClaudeInstanceManager:
                 if is_worker:
                     if is_now_idle and not was_idle:
                         # Newly idle: start tracking
-                        updates["idle_since"] = datetime.now()
+                        updates["idle_since"] = now
                         updates["auto_notified"] = False
                     elif is_now_idle and was_idle:
                         # Still idle: check for auto-notification
                         if instance.idle_since and not instance.auto_notified:
-                            idle_seconds = (datetime.now() - instance.idle_since).total_seconds()
+                            idle_seconds = (now - instance.idle_since).total_seconds()
                             if idle_seconds > 30:
                                 self._send_auto_idle_notification(instance)
                                 updates["auto_notified"] = True
@@ -345,75 +439,128 @@ class ClaudeInstanceManager:
                         updates["idle_since"] = None
                         updates["auto_notified"] = False
 
-                self.store.update(instance.id, **updates)
+                all_updates[instance.id] = updates
+
+        self.store.update_many(all_updates)
+        return live_windows
 
-    def get_activity(self, identifier: str, last_n: int = 30) -> list[LogEntry]:
+    def _get_log_reader(self, identifier: InstanceRef) -> Optional[ClaudeLogReader]:
+        """Log reader for an instance, recording its Claude session ID if not yet known."""
+        instance = self._resolve(identifier)
+        if not instance:
+            return None
+
+        log_reader = self._log_reader_for(instance.working_dir)
+
+        # Try to detect and store session ID if not already known
+        if not instance.claude_session_id:
+            session_id = log_reader.get_session_id()
+            if session_id:
+                self.store.update(instance.id, claude_session_id=session_id)
+
+        return log_reader
+
+    def get_activity(self, identifier: InstanceRef, last_n: int = 30) -> list[LogEntry]:
         """
         Get structured activity from Claude Code conversation logs.
 
         Args:
-            identifier: Instance ID or name
+            identifier: Instance ID or name, or the instance itself
             last_n: Number of recent log entries to return
 
         Returns:
             List of parsed LogEntry objects
         """
-        instance = self.store.find_by_name_or_id(identifier)
-        if not instance:
+        log_reader = self._get_log_reader(identifier)
+        if log_reader is None:
             return []
+        return log_reader.read_entries(last_n=last_n)
 
-        log_reader = ClaudeLogReader(instance.working_dir)
+    def get_activity_since(self, identifier: InstanceRef, cursor: LogCursor) -> tuple[list[LogEntry], LogCursor]:
+        """
+        Get log entries written after cursor.
 
-        # Try to detect and store session ID if not already known
-        if not instance.claude_session_id:
-            session_id = log_reader.get_session_id()
-            if session_id:
-                self.store.update(instance.id, claude_session_id=session_id)
+        Args:
+            identifier: Instance ID or name, or the instance itself
+            cursor: Cursor from a previous call or get_activity_cursor()
 
-        return log_reader.read_entries(last_n=last_n)
+        Returns:
+            (new entries, updated cursor)
+        """
+        log_reader = self._get_log_reader(identifier)
+        if log_reader is None:
+            return [], cursor
+        return log_reader.read_entries_since(cursor)
+
+    def get_activity_cursor(self, identifier: InstanceRef) -> LogCursor:
+        """Cursor at the current end of an instance's latest session log."""
+        instance = self._resolve(identifier)
+        if not instance:
+            return LogCursor()
+        return self._log_reader_for(instance.working_dir).end_cursor()
 
-    def get_activity_formatted(self, identifier: str, last_n: int = 30) -> str:
+    def get_activity_formatted(self, identifier: InstanceRef, last_n: int = 30) -> str:
         """
         Get formatted activity string for display.
 
         Args:
-            identifier: Instance ID or name
+            identifier: Instance ID or name, or the instance itself
             last_n: Number of recent log entries
 
         Returns:
             Formatted string for display
         """
-        entries = self.get_activity(identifier, last_n)
+        instance = self._resolve(identifier)
+        if not instance:
+            return "[No activity yet]"
+        entries = self.get_activity(instance, last_n)
         if not entries:
             return "[No activity yet]"
-        return format_activity(entries)
-
-    def set_display_mode(self, identifier: str, mode: DisplayMode) -> bool:
+        # read_entries hands back the same list while the log is unchanged, so an
+        # identical list means the previous text (the same str object) still applies
+        cached = self._formatted_activity.get(instance.id)
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+        # The reader hands back already-parsed entries as the same objects, so only
+        # entries new since the last call are formatted. The ids are safe to reuse:
+        # the cached entries list keeps the previous entries alive.
+        previous = cached[2] if cached is not None else {}
+        lines: dict[int, Optional[str]] = {}
+        for entry in entries:
+            key = id(entry)
+            lines[key] = previous[key] if key in previous else format_entry(entry)
+        text = "\n".join(filter(None, (lines[id(entry)] for entry in entries)))
+        self._formatted_activity[instance.id] = (entries, text, lines)
+        return text
+
+    def set_display_mode(self, identifier: InstanceRef, mode: DisplayMode) -> bool:
         """Set the display mode for an instance."""
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return False
         self.store.update(instance.id, display_mode=mode)
         return True
 
-    def get_display_mode(self, identifier: str) -> DisplayMode:
+    def get_display_mode(self, identifier: InstanceRef) -> DisplayMode:
         """Get the current display mode for an instance."""
-        instance = self.store.find_by_name_or_id(identifier)
+        instance = self._resolve(identifier)
         if not instance:
             return DisplayMode.ACTIVITY
         return DisplayMode(instance.display_mode)
 
     # Notification methods
 
-    def _get_notification_store(self) -> NotificationStore:
+    def _get_notification_store(self) -> "NotificationStore":
         """Lazy loader for notification store."""
         if self._notification_store is None:
+            from .notifications import NotificationStore
+
             self._notification_store = NotificationStore()
         return self._notification_store
 
     def send_notification(
         self,
-        worker_identifier: str,
+        worker_identifier: InstanceRef,
         status: NotificationStatus,
         message: Optional[str] = None,
         primary_name: str = "primary",
@@ -431,7 +578,7 @@ class ClaudeInstanceManager:
             Tuple of (success, notification_id or error message)
         """
         # Resolve worker instance
-        worker = self.store.find_by_name_or_id(worker_identifier)
+        worker = self._resolve(worker_identifier)
         if not worker:
             return False, f"Worker instance not found: {worker_identifier}"
 
@@ -474,7 +621,7 @@ class ClaudeInstanceManager:
 
         if success:
             # Mark as delivered
-            store.mark_delivered(filepath)
+            store.mark_delivered(filepath, notification)
             return True, notification.id
         else:
             return False, "Failed to send notification to primary"
@@ -483,7 +630,7 @@ class ClaudeInstanceManager:
         """Send automatic notification when worker has been idle for too long."""
         message = "[AUTO] Worker idle for 30+ sec - task may be complete"
         success, result = self.send_notification(
-            worker_identifier=worker.id,
+            worker_identifier=worker,
             status=NotificationStatus.INFO,
             message=message,
             primary_name="primary",
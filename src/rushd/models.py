@@ -2,10 +2,11 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class InstanceStatus(str, Enum):
@@ -61,6 +62,9 @@ class InstanceMetadata(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     model: Optional[str] = Field(default=None, description="Claude model being used")
     last_activity: Optional[datetime] = Field(default=None)
+    last_refreshed: Optional[datetime] = Field(
+        default=None, description="When refresh_statuses last checked this instance"
+    )
 
     # New fields for v0.2
     claude_session_id: Optional[str] = Field(default=None, description="Claude Code session UUID")
@@ -71,8 +75,29 @@ class InstanceMetadata(BaseModel):
     idle_since: Optional[datetime] = Field(default=None, description="Timestamp when instance first became idle")
     auto_notified: bool = Field(default=False, description="Whether auto-notification was sent for current idle period")
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
+
+    # Display values derived once per loaded instance (not persisted)
+
+    @cached_property
+    def short_id(self) -> str:
+        """First 8 characters of the instance ID."""
+        return self.id[:8]
+
+    @cached_property
+    def display_name(self) -> str:
+        """Name to show for the instance: its name, else its short ID."""
+        return self.name or self.short_id
+
+    @cached_property
+    def working_dir_str(self) -> str:
+        """Working directory as a string."""
+        return str(self.working_dir)
+
+    @cached_property
+    def created_at_iso(self) -> Optional[str]:
+        """Creation time in ISO 8601 format."""
+        return self.created_at.isoformat() if self.created_at else None
 
 
 class InstanceStore(BaseModel):
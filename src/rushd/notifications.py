@@ -1,34 +1,65 @@
 """Notification storage for rushd worker-to-primary communication."""
 
-import json
+import glob
+import os
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from . import jsonutil
+from .config import NOTIFICATIONS_DIR, mtime_trusted
 from .models import Notification, NotificationStatus
 
+# Characters replaced with "_" when a worker name is used in a filename
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-]")
+# The same substitution for ASCII names as a str.translate table (index = code point)
+_SAFE_ASCII_TABLE = "".join(
+    c if c.isalnum() or c in "_-" else "_" for c in map(chr, range(128))
+)
+
 
 class NotificationStore:
     """Manages notification storage for worker-to-primary communication."""
 
+    # Parsed notifications shared by every store in the process:
+    # store dir -> file path -> (st_mtime_ns, notification)
+    _cache: dict[Path, dict[str, tuple[int, Notification]]] = {}
+    # Directory listings: store dir -> (dir st_mtime_ns, [(st_mtime_ns, path), ...])
+    _listing_cache: dict[Path, tuple[int, list[tuple[int, str]]]] = {}
+
     def __init__(
         self,
         store_dir: Optional[Path] = None,
         retention_days: int = 7,
     ):
-        self.store_dir = store_dir or Path.home() / ".rushd" / "notifications"
+        self.store_dir = store_dir or NOTIFICATIONS_DIR
         self.retention_days = retention_days
 
         # Ensure store directory exists
         self.store_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_filename(self, notification: Notification) -> str:
-        """Generate filename: {worker_name}_{worker_id}_{timestamp}.json"""
+        """Generate filename: {worker_name}_{worker_id}_{timestamp}_{id}.json
+
+        The trailing notification ID lets get_by_id find the file without opening others.
+        """
         timestamp = notification.created_at.strftime("%Y%m%d_%H%M%S")
-        # Sanitize worker name for filesystem
-        safe_name = re.sub(r"[^\w\-]", "_", notification.worker_name or "unknown")
-        return f"{safe_name}_{notification.worker_id}_{timestamp}.json"
+        # Sanitize worker name for filesystem; names are almost always ASCII, where a
+        # translate table does it without the regex engine (\w also keeps non-ASCII letters)
+        name = notification.worker_name or "unknown"
+        if name.isascii():
+            safe_name = name.translate(_SAFE_ASCII_TABLE)
+        else:
+            safe_name = UNSAFE_FILENAME_CHARS.sub("_", name)
+        return f"{safe_name}_{notification.worker_id}_{timestamp}_{notification.id}.json"
+
+    def _write_atomic(self, filepath: Path, data: bytes) -> None:
+        """Write data via a temp file and rename, so readers never see a partial file."""
+        tmp_path = filepath.with_suffix(".json.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, filepath)
 
     def save(self, notification: Notification) -> Path:
         """
@@ -43,60 +74,82 @@ class NotificationStore:
         filename = self._get_filename(notification)
         filepath = self.store_dir / filename
 
-        data = notification.model_dump(mode="json")
-        # Convert datetime to ISO format strings
-        if data.get("created_at"):
-            data["created_at"] = notification.created_at.isoformat()
-        if data.get("delivered_at") and notification.delivered_at:
-            data["delivered_at"] = notification.delivered_at.isoformat()
-
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        # pydantic-core writes datetimes as ISO 8601 strings directly
+        self._write_atomic(filepath, notification.model_dump_json().encode())
 
         return filepath
 
-    def mark_delivered(self, filepath: Path) -> bool:
+    def mark_delivered(self, filepath: Path, notification: Optional[Notification] = None) -> bool:
         """
         Mark a notification as delivered.
 
         Args:
             filepath: Path to the notification file
+            notification: The notification saved at filepath, if the caller still has it;
+                the file is then rewritten without being read back first
 
         Returns:
             True if successfully updated
         """
-        if not filepath.exists():
-            return False
-
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            if notification is not None:
+                delivered = notification.model_copy(
+                    update={"delivered": True, "delivered_at": datetime.now()}
+                )
+                self._write_atomic(filepath, delivered.model_dump_json().encode())
+                return True
+
+            data = jsonutil.loads(filepath.read_bytes())
 
             data["delivered"] = True
             data["delivered_at"] = datetime.now().isoformat()
 
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
+            self._write_atomic(filepath, jsonutil.dumps(data))
 
             return True
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             return False
 
     def _load_notification(self, filepath: Path) -> Optional[Notification]:
         """Load a notification from a file."""
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            # Parses and validates (including the ISO datetime fields) in one native pass
+            return Notification.model_validate_json(filepath.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _list_files(self) -> Optional[list[tuple[int, str]]]:
+        """
+        (st_mtime_ns, path) of every notification file, newest first.
 
-            # Parse datetime fields
-            if data.get("created_at"):
-                data["created_at"] = datetime.fromisoformat(data["created_at"])
-            if data.get("delivered_at"):
-                data["delivered_at"] = datetime.fromisoformat(data["delivered_at"])
+        Every write here is a rename into the directory, so an unchanged directory
+        mtime means the previous listing is still accurate and the scan is skipped.
+        """
+        try:
+            dir_mtime = self.store_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+        cached = self._listing_cache.get(self.store_dir)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
 
-            return Notification(**data)
-        except (json.JSONDecodeError, OSError, ValueError):
+        files: list[tuple[int, str]] = []
+        try:
+            with os.scandir(self.store_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.name.endswith(".json"):
+                        try:
+                            files.append((dir_entry.stat().st_mtime_ns, dir_entry.path))
+                        except OSError:
+                            continue
+        except OSError:
             return None
+        files.sort(reverse=True)
+        # Timestamps are coarse, so a write later in the same tick would leave dir_mtime
+        # unchanged; only trust listings of directories that have been quiet for a while
+        if mtime_trusted(dir_mtime):
+            self._listing_cache[self.store_dir] = (dir_mtime, files)
+        return files
 
     def list_notifications(
         self,
@@ -120,20 +173,33 @@ class NotificationStore:
 
         notifications: list[Notification] = []
 
-        # Get all JSON files, sorted by modification time (newest first)
-        files = sorted(
-            self.store_dir.glob("*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        files = self._list_files()
+        if files is None:
+            return []
+
+        # Forget cached notifications whose files are gone
+        cache = self._cache.setdefault(self.store_dir, {})
+        if len(cache) > len(files):
+            present = {path for _, path in files}
+            for path in [path for path in cache if path not in present]:
+                del cache[path]
 
-        for filepath in files:
+        now_ns = time.time_ns()
+        for mtime_ns, path in files:
             if len(notifications) >= limit:
                 break
 
-            notification = self._load_notification(filepath)
-            if not notification:
-                continue
+            cached = cache.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                notification = cached[1]
+            else:
+                notification = self._load_notification(Path(path))
+                if not notification:
+                    continue
+                # Same coarse-timestamp caveat as _list_files: a rewrite in the same
+                # tick (save then mark_delivered) could keep this mtime
+                if mtime_trusted(mtime_ns, now_ns):
+                    cache[path] = (mtime_ns, notification)
 
             # Apply filters
             if worker_id and notification.worker_id != worker_id:
@@ -152,18 +218,21 @@ class NotificationStore:
         Returns:
             Count of deleted files
         """
-        if not self.store_dir.exists():
+        files = self._list_files()
+        if not files:
             return 0
 
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        cutoff_ns = time.time_ns() - self.retention_days * 86_400 * 1_000_000_000
         count = 0
 
-        for filepath in self.store_dir.glob("*.json"):
+        # The listing is newest first, so walk it from the oldest end and stop at the
+        # first file inside the retention window
+        for mtime_ns, path in reversed(files):
+            if mtime_ns >= cutoff_ns:
+                break
             try:
-                mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
-                if mtime < cutoff:
-                    filepath.unlink()
-                    count += 1
+                os.unlink(path)
+                count += 1
             except OSError:
                 pass
 
@@ -182,7 +251,16 @@ class NotificationStore:
         if not self.store_dir.exists():
             return None
 
+        # Files written since IDs were added to filenames are found by name
+        for filepath in self.store_dir.glob(f"*_{glob.escape(notification_id)}.json"):
+            notification = self._load_notification(filepath)
+            if notification and notification.id == notification_id:
+                return notification
+
+        # Older files only carry the ID inside, so fall back to scanning them
         for filepath in self.store_dir.glob("*.json"):
+            if filepath.stem.endswith(notification_id):
+                continue  # already checked above
             notification = self._load_notification(filepath)
             if notification and notification.id == notification_id:
                 return notification
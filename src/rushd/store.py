@@ -1,20 +1,41 @@
 """JSON persistence for instance metadata."""
 
 import fcntl
-import json
+import os
+import threading
 from contextlib import contextmanager
+from enum import Enum
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Optional, TextIO
 
+from pydantic import ValidationError
+
+from .config import INSTANCES_PATH, mtime_trusted
 from .models import InstanceMetadata, InstanceStore as StoreModel, InstanceStatus
 
+# cached_property names on InstanceMetadata, dropped when an update copies an instance
+CACHED_DISPLAY_FIELDS = ("short_id", "display_name", "working_dir_str", "created_at_iso")
+
 
 class InstanceStore:
     """Manages persistence of instance metadata to ~/.rushd/instances.json."""
 
+    # Parsed stores shared by every InstanceStore in the process:
+    # path -> (st_mtime_ns, st_size, trusted, raw bytes, store)
+    _cache: dict[Path, tuple[int, int, bool, bytes, StoreModel]] = {}
+    # Lookup indexes for the parsed store last indexed at each path:
+    # path -> (store, name -> instance, tmux pane ID -> instance)
+    _index_cache: dict[
+        Path, tuple[StoreModel, dict[str, InstanceMetadata], dict[str, InstanceMetadata]]
+    ] = {}
+
     def __init__(self, store_path: Optional[Path] = None):
-        self.store_path = store_path or Path.home() / ".rushd" / "instances.json"
+        self.store_path = store_path or INSTANCES_PATH
         self._lock_path = self.store_path.with_suffix(".lock")
+        self._lock_file: Optional[TextIO] = None
+        # flock belongs to the open lock file, which this store's threads share, so it
+        # cannot keep them apart (the TUI polls on a worker thread); this lock does
+        self._thread_lock = threading.RLock()
         self._ensure_dir()
 
     def _ensure_dir(self) -> None:
@@ -29,85 +50,199 @@ class InstanceStore:
         Args:
             exclusive: If True, acquire exclusive (write) lock. If False, shared (read) lock.
         """
-        self._ensure_dir()
-        lock_file = open(self._lock_path, "w")
-        try:
+        with self._thread_lock:
+            # Every store operation takes this lock, so the lock file is opened once
+            # and kept rather than opened and closed around each call
+            if self._lock_file is None:
+                self._ensure_dir()
+                self._lock_file = open(self._lock_path, "a")
+            fd = self._lock_file.fileno()
             lock_type = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
-            fcntl.flock(lock_file.fileno(), lock_type)
-            yield
-        finally:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-            lock_file.close()
-
-    def _load_raw(self) -> StoreModel:
-        """Load the store from disk (caller should hold lock if needed)."""
-        if not self.store_path.exists():
+            fcntl.flock(fd, lock_type)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the lock file; it is reopened on the next store operation."""
+        with self._thread_lock:
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+
+    def _stat_key(self) -> Optional[tuple[int, int]]:
+        """Return (st_mtime_ns, st_size) for the store file, or None if missing."""
+        try:
+            st = self.store_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load_raw(self, for_write: bool = False, locked: bool = True) -> StoreModel:
+        """
+        Load the store from disk (caller should hold lock if needed).
+
+        Reads reuse the parsed store until the file's mtime or size changes; other
+        rushd processes write the same file, so it is re-validated on every call.
+        Writers get a private copy so a failed save cannot leave the cache ahead of disk.
+        With locked=False the caller holds no lock (see _read).
+        """
+        key = self._stat_key()
+        if key is None:
             return StoreModel()
+        cached = self._cache.get(self.store_path)
+        if not for_write and cached is not None and cached[:2] == key and cached[2]:
+            return cached[4]
         try:
-            with open(self.store_path, "r") as f:
-                data = json.load(f)
-            return StoreModel.model_validate(data)
-        except (json.JSONDecodeError, IOError):
+            with open(self.store_path, "rb") as f:
+                # Key the bytes by the file actually opened; without the lock a writer
+                # may have renamed a new file into place since the stat above
+                st = os.fstat(f.fileno())
+                data = f.read()
+        except OSError:
             return StoreModel()
+        key = (st.st_mtime_ns, st.st_size)
+        # A same-size write by another process in the same timestamp tick would keep
+        # this key, so a file read while its mtime is that fresh is not trusted by key;
+        # its bytes are compared instead, which still skips parsing and validation
+        trusted = mtime_trusted(key[0])
+        if not for_write and cached is not None and cached[3] == data:
+            store = cached[4]
+        else:
+            try:
+                # pydantic-core parses and validates in one pass, without an intermediate dict
+                store = StoreModel.model_validate_json(data)
+            except ValidationError as e:
+                if any(err["type"] == "json_invalid" for err in e.errors()):
+                    if not locked:
+                        # Current writers rename a complete file into place, so this is
+                        # a torn in-place write (e.g. an older rushd); re-read under the lock
+                        with self._file_lock(exclusive=False):
+                            return self._load_raw()
+                    return StoreModel()
+                raise
+        if not for_write:
+            self._cache[self.store_path] = (*key, trusted, data, store)
+        return store
+
+    def _read(self) -> StoreModel:
+        """
+        Load the store for a read-only caller without taking the lock.
+
+        _save_raw replaces the file by rename, so an unlocked read sees either the old
+        or the new file in full; readers no longer wait on each other or on the lock file.
+        """
+        return self._load_raw(locked=False)
+
+    def _indexes(
+        self, store: StoreModel
+    ) -> tuple[dict[str, InstanceMetadata], dict[str, InstanceMetadata]]:
+        """
+        (name -> instance, pane ID -> instance) for a loaded store.
+
+        Built once per parsed store: _load_raw hands back the same object while the
+        file is unchanged, so the indexes are reused until it changes. Like the scans
+        they replace, the first instance in store order wins a duplicate key.
+        """
+        cached = self._index_cache.get(self.store_path)
+        if cached is not None and cached[0] is store:
+            return cached[1], cached[2]
+        by_name: dict[str, InstanceMetadata] = {}
+        by_pane: dict[str, InstanceMetadata] = {}
+        for inst in store.instances.values():
+            if inst.name:
+                by_name.setdefault(inst.name, inst)
+            by_pane.setdefault(inst.tmux_pane_id, inst)
+        self._index_cache[self.store_path] = (store, by_name, by_pane)
+        return by_name, by_pane
 
     def _save_raw(self, store: StoreModel) -> None:
         """Save the store to disk (caller should hold lock if needed)."""
-        self._ensure_dir()
-        with open(self.store_path, "w") as f:
-            json.dump(store.model_dump(mode="json"), f, indent=2, default=str)
+        # Written beside the store and renamed over it, so a crash mid-write leaves the
+        # previous file intact rather than a truncated one
+        tmp_path = self.store_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(store.model_dump_json().encode())
+        os.replace(tmp_path, self.store_path)
+        # The cached bytes no longer match the file; the next read re-parses it
+        self._cache.pop(self.store_path, None)
 
     def load(self) -> dict[str, InstanceMetadata]:
         """Load all instances from storage."""
-        with self._file_lock(exclusive=False):
-            return self._load_raw().instances
+        return self._read().instances
+
+    @contextmanager
+    def _mutate(self) -> Generator[StoreModel, None, None]:
+        """
+        Yield a private copy of the store under the exclusive lock and save it on exit.
+
+        One load and one save per mutation; an exception inside the block skips the save.
+        """
+        with self._file_lock(exclusive=True):
+            store = self._load_raw(for_write=True)
+            yield store
+            self._save_raw(store)
 
     def save(self, instances: dict[str, InstanceMetadata]) -> None:
         """Save all instances to storage."""
-        with self._file_lock(exclusive=True):
-            store = self._load_raw()
+        with self._mutate() as store:
             store.instances = instances
-            self._save_raw(store)
 
     def find_by_name(self, name: str) -> Optional[InstanceMetadata]:
         """Find an instance by exact name match."""
-        with self._file_lock(exclusive=False):
-            store = self._load_raw()
-            for inst in store.instances.values():
-                if inst.name and inst.name == name:
-                    return inst
-            return None
+        return self._indexes(self._read())[0].get(name)
 
     def add(self, instance: InstanceMetadata) -> None:
         """Add a new instance to storage. Raises ValueError if name already exists."""
-        with self._file_lock(exclusive=True):
+        with self._mutate() as store:
             if instance.name:
-                store = self._load_raw()
                 for inst in store.instances.values():
                     if inst.name and inst.name == instance.name:
                         raise ValueError(
                             f"Instance with name '{instance.name}' already exists (id: {inst.id})"
                         )
-            store = self._load_raw()
             store.instances[instance.id] = instance
-            self._save_raw(store)
 
     def update(self, instance_id: str, **updates) -> Optional[InstanceMetadata]:
         """Update an existing instance."""
+        return self.update_many({instance_id: updates}).get(instance_id)
+
+    def update_many(self, updates: dict[str, dict]) -> dict[str, InstanceMetadata]:
+        """
+        Update several instances with one load and one save.
+
+        Args:
+            updates: Instance ID -> fields to set on it
+
+        Returns:
+            The updated instances by ID; IDs not in the store are skipped
+        """
+        if not updates:
+            return {}
         with self._file_lock(exclusive=True):
-            store = self._load_raw()
-            if instance_id not in store.instances:
-                return None
-            instance = store.instances[instance_id]
-            updated_data = instance.model_dump()
-            updated_data.update(updates)
-            store.instances[instance_id] = InstanceMetadata.model_validate(updated_data)
-            self._save_raw(store)
-            return store.instances[instance_id]
+            store = self._load_raw(for_write=True)
+            updated: dict[str, InstanceMetadata] = {}
+            for instance_id, fields in updates.items():
+                instance = store.instances.get(instance_id)
+                if instance is None:
+                    continue
+                # model_copy skips re-validating every field; callers pass values of the
+                # field types, so only use_enum_values needs replaying by hand
+                instance = instance.model_copy(
+                    update={k: v.value if isinstance(v, Enum) else v for k, v in fields.items()}
+                )
+                # model_copy copies the original's __dict__, cached display values included
+                for name in CACHED_DISPLAY_FIELDS:
+                    instance.__dict__.pop(name, None)
+                store.instances[instance_id] = updated[instance_id] = instance
+            if updated:
+                self._save_raw(store)
+            return updated
 
     def remove(self, instance_id: str) -> bool:
         """Remove an instance from storage."""
         with self._file_lock(exclusive=True):
-            store = self._load_raw()
+            store = self._load_raw(for_write=True)
             if instance_id not in store.instances:
                 return False
             del store.instances[instance_id]
@@ -116,60 +251,50 @@ class InstanceStore:
 
     def get(self, instance_id: str) -> Optional[InstanceMetadata]:
         """Get an instance by ID."""
-        with self._file_lock(exclusive=False):
-            return self._load_raw().instances.get(instance_id)
+        return self._read().instances.get(instance_id)
 
     def list_all(self, include_stopped: bool = False) -> list[InstanceMetadata]:
         """List all instances, optionally including stopped ones."""
-        with self._file_lock(exclusive=False):
-            instances = list(self._load_raw().instances.values())
-            if not include_stopped:
-                instances = [i for i in instances if i.status != InstanceStatus.STOPPED]
-            return sorted(instances, key=lambda x: x.created_at)
+        instances = list(self._read().instances.values())
+        if not include_stopped:
+            instances = [i for i in instances if i.status != InstanceStatus.STOPPED]
+        return sorted(instances, key=lambda x: x.created_at)
 
     def find_by_name_or_id(self, identifier: str) -> Optional[InstanceMetadata]:
         """Find an instance by name or ID (partial match supported)."""
-        with self._file_lock(exclusive=False):
-            store = self._load_raw()
+        store = self._read()
 
-            # Exact ID match
-            if identifier in store.instances:
-                return store.instances[identifier]
+        # Exact ID match
+        if identifier in store.instances:
+            return store.instances[identifier]
 
-            # Partial ID match
-            for inst_id, inst in store.instances.items():
-                if inst_id.startswith(identifier):
-                    return inst
+        # One pass returns the first partial ID match, which outranks any name
+        # match, and remembers the first partial name match on the way
+        ident_lower = identifier.lower()
+        partial_name = None
+        for inst_id, inst in store.instances.items():
+            if inst_id.startswith(identifier):
+                return inst
+            if partial_name is None and inst.name and ident_lower in inst.name.lower():
+                partial_name = inst
 
-            # Name match
-            for inst in store.instances.values():
-                if inst.name and inst.name == identifier:
-                    return inst
+        # Name match
+        inst = self._indexes(store)[0].get(identifier)
+        if inst is not None:
+            return inst
 
-            # Partial name match
-            for inst in store.instances.values():
-                if inst.name and identifier.lower() in inst.name.lower():
-                    return inst
-
-            return None
+        # Partial name match
+        return partial_name
 
     def find_by_pane_id(self, pane_id: str) -> Optional[InstanceMetadata]:
         """Find an instance by its tmux pane ID."""
-        with self._file_lock(exclusive=False):
-            store = self._load_raw()
-            for inst in store.instances.values():
-                if inst.tmux_pane_id == pane_id:
-                    return inst
-            return None
+        return self._indexes(self._read())[1].get(pane_id)
 
     def get_session_name(self) -> str:
         """Get the tmux session name."""
-        with self._file_lock(exclusive=False):
-            return self._load_raw().session_name
+        return self._read().session_name
 
     def clear_all(self) -> None:
         """Clear all instances from storage."""
-        with self._file_lock(exclusive=True):
-            store = self._load_raw()
+        with self._mutate() as store:
             store.instances = {}
-            self._save_raw(store)
@@ -1,11 +1,12 @@
 """Tmux controller for managing Claude Code instances in tmux windows."""
 
-import hashlib
 import logging
 import re
+import shlex
 import subprocess
+import threading
 import time
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 
 # Regex pattern for valid tmux pane IDs (e.g., %5, %123)
@@ -14,15 +15,136 @@ PANE_ID_PATTERN = re.compile(r"^%\d+$")
 logger = logging.getLogger(__name__)
 
 
+def _quote_tmux_arg(arg: str) -> str:
+    """Single-quote an argument for tmux's command parser (no expansion inside quotes)."""
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+class TmuxControlClient:
+    """
+    Runs tmux commands over one long-lived control-mode client (tmux -C).
+
+    Each command is a line written to the client's stdin; tmux answers with the
+    command's output framed by %begin/%end (or %error) lines, so polling costs a
+    pipe round trip instead of spawning the tmux binary. Lines outside a frame
+    are notifications and are skipped.
+    """
+
+    # Wait this long before trying to start the client again after it failed or exited
+    RETRY_INTERVAL = 5.0
+
+    def __init__(self, session_name: str):
+        self.session_name = session_name
+        self._proc: Optional[subprocess.Popen] = None
+        self._retry_at = 0.0
+        self._lock = threading.RLock()
+
+    def _start(self) -> bool:
+        """Attach the control client to the session; False if tmux refused."""
+        self._proc = subprocess.Popen(
+            # no-output: skip %output for every pane update; ignore-size: never resize windows
+            ["tmux", "-C", "attach-session", "-t", self.session_name, "-f", "no-output,ignore-size"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        # The attach itself is answered with a frame; %error means no such session
+        for line in self._proc.stdout:
+            if line.startswith("%end "):
+                return True
+            if line.startswith("%error "):
+                break
+        self.close()
+        return False
+
+    def run(self, args: list[str]) -> Optional[tuple[str, int]]:
+        """
+        Run a tmux command and return (output, exit_code).
+
+        Returns None if the client is unavailable and the command was not sent,
+        so the caller can run it another way.
+        """
+        # One command at a time: the TUI polls from a worker thread while its UI
+        # thread sends commands, and replies are matched to commands by order
+        with self._lock:
+            return self._run(args)
+
+    def _run(self, args: list[str]) -> Optional[tuple[str, int]]:
+        """run() with the client lock held."""
+        if self._proc is None:
+            if time.monotonic() < self._retry_at:
+                return None
+            if not self._start():
+                self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+                return None
+        proc = self._proc
+        try:
+            proc.stdin.write(" ".join(map(_quote_tmux_arg, args)) + "\n")
+            proc.stdin.flush()
+        except OSError:
+            self.close()
+            return None
+
+        number = None
+        output: list[str] = []
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if number is None:
+                if line.startswith("%begin "):
+                    number = line.split(" ")[2]
+                continue
+            fields = line.split(" ")
+            if fields[0] in ("%end", "%error") and len(fields) == 4 and fields[2] == number:
+                # Like the tmux CLI, report error text as failure rather than as output
+                if fields[0] == "%error":
+                    return "", 1
+                return "\n".join(output).strip(), 0
+            output.append(line)
+
+        # The client exited (session or server gone)
+        self.close()
+        self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+        # Once the command was framed it ran, so it must not be sent again
+        return None if number is None else ("", 1)
+
+    def close(self) -> None:
+        """Detach the control client."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            proc.wait()
+
+
 class TmuxController:
     """Controller for managing tmux sessions and windows for Claude Code instances."""
 
+    # Polling commands sent through the control-mode client. All of them carry an
+    # explicit -t/-a target, so they resolve the same as from the CLI; anything else
+    # (new-window, kill-session, display-message without -t) still spawns tmux.
+    CONTROL_COMMANDS = frozenset({
+        "capture-pane", "has-session", "kill-window", "list-panes",
+        "list-windows", "select-window", "send-keys",
+    })
+
     def __init__(self, session_name: str = "rushd-instances"):
         self.session_name = session_name
+        self._control = TmuxControlClient(session_name)
         self._ensure_session()
 
     def _run_tmux(self, args: list[str], check: bool = False) -> tuple[str, int]:
         """Run a tmux command and return (stdout, exit_code)."""
+        # A newline would end the command line early, so such arguments take the CLI path
+        if args[0] in self.CONTROL_COMMANDS and not any("\n" in arg for arg in args):
+            result = self._control.run(args)
+            if result is not None:
+                return result
         cmd = ["tmux"] + args
         result = subprocess.run(cmd, capture_output=True, text=True)
         return result.stdout.strip(), result.returncode
@@ -64,12 +186,15 @@ class TmuxController:
     def create_window(
         self,
         name: str,
-        command: str,
+        command: Union[str, Sequence[str]],
         working_dir: Optional[str] = None
     ) -> tuple[str, str]:
         """
         Create a new window in the session and run a command.
 
+        command is a shell command string, or an argv list that is quoted
+        with shlex.join here.
+
         Returns (window_target, pane_id).
         """
         self._ensure_session()
@@ -77,7 +202,7 @@ class TmuxController:
         args = ["new-window", "-t", self.session_name, "-n", name, "-P", "-F", "#{window_index}:#{pane_id}"]
         if working_dir:
             args.extend(["-c", working_dir])
-        args.append(command)
+        args.append(command if isinstance(command, str) else shlex.join(command))
 
         output, code = self._run_tmux(args)
         if code != 0:
@@ -125,20 +250,45 @@ class TmuxController:
             return []
 
         windows = []
-        for line in output.strip().split("\n"):
-            if not line:
+        for line in output.splitlines():
+            # The command is the last field, so a "|" inside it stays in place
+            parts = line.split("|", 3)
+            if len(parts) < 4:
                 continue
-            parts = line.split("|")
-            if len(parts) >= 4:
-                windows.append({
-                    "index": parts[0],
-                    "name": parts[1],
-                    "pane_id": parts[2],
-                    "command": parts[3],
-                    "target": f"{self.session_name}:{parts[0]}"
-                })
+            index, name, pane_id, command = parts
+            windows.append({
+                "index": index,
+                "name": name,
+                "pane_id": pane_id,
+                "command": command,
+                "target": f"{self.session_name}:{index}"
+            })
         return windows
 
+    def list_all_panes(self) -> dict[str, dict]:
+        """
+        List every live pane on the tmux server with a single tmux call.
+
+        Returns a dict keyed by window target (e.g., rushd-instances:1) so
+        callers can check many windows without spawning tmux per window.
+        Windows whose pane has exited are omitted.
+        """
+        output, code = self._run_tmux([
+            "list-panes", "-a",
+            "-F", "#{session_name}:#{window_index}|#{pane_id}|#{pane_dead}|#{pane_current_command}"
+        ])
+        if code != 0:
+            return {}
+
+        panes: dict[str, dict] = {}
+        for line in output.split("\n"):
+            parts = line.split("|")
+            if len(parts) < 4 or parts[2] == "1":
+                continue
+            # Keep the first pane of each window (windows typically have one pane)
+            panes.setdefault(parts[0], {"pane_id": parts[1], "command": parts[3]})
+        return panes
+
     def window_exists(self, window_target: str) -> bool:
         """Check if a specific window exists."""
         _, code = self._run_tmux(["select-window", "-t", window_target])
@@ -180,6 +330,11 @@ class TmuxController:
 
         return True
 
+    def send_key_sequence(self, window_target: str, keys: list[str]) -> bool:
+        """Send several key names (e.g. 'Down', 'Escape') in one tmux call."""
+        _, code = self._run_tmux(["send-keys", "-t", window_target, *keys])
+        return code == 0
+
     def send_interrupt(self, window_target: str) -> bool:
         """Send Ctrl+C to a window."""
         _, code = self._run_tmux(["send-keys", "-t", window_target, "C-c"])
@@ -204,23 +359,23 @@ class TmuxController:
         """
         Wait until the pane output stops changing.
 
-        Uses MD5 hashing to detect changes efficiently.
+        Compares each capture with the previous one directly; string equality
+        stops at the first differing character, so there is nothing to hash.
         """
         start = time.time()
-        last_hash = None
+        last_content = None
         stable = 0
 
         while time.time() - start < timeout:
             content = self.capture_pane(window_target)
-            current_hash = hashlib.md5(content.encode()).hexdigest()
 
-            if current_hash == last_hash:
+            if content == last_content:
                 stable += 1
                 if stable >= stable_count:
                     return True
             else:
                 stable = 0
-                last_hash = current_hash
+                last_content = content
 
             time.sleep(poll_interval)
 
@@ -251,6 +406,8 @@ class TmuxController:
 
     def cleanup_session(self) -> bool:
         """Kill the entire managed session."""
+        # The control client is attached to this session and would be dropped with it
+        self._control.close()
         _, code = self._run_tmux(["kill-session", "-t", self.session_name])
         return code == 0
 
@@ -1,8 +1,10 @@
 """Interactive TUI for rushd using Textual."""
 
+import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+from rich.highlighter import ReprHighlighter
 from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
@@ -12,7 +14,7 @@ from textual.widgets import Button, Footer, Header, Input, Static, RichLog
 
 from .config import ConfigManager
 from .manager import ClaudeInstanceManager
-from .models import InstanceStatus, DisplayMode
+from .models import InstanceMetadata, InstanceStatus, DisplayMode
 
 # Status indicators for TUI tabs
 STATUS_INDICATORS = {
@@ -25,6 +27,70 @@ STATUS_INDICATORS = {
     InstanceStatus.ERROR: ("!", "red"),
 }
 
+# Status markup in the /list output
+STATUS_DISPLAY = {
+    InstanceStatus.RUNNING: "[green]running[/green]",
+    InstanceStatus.STARTING: "[yellow]starting...[/yellow]",
+    InstanceStatus.THINKING: "[cyan]thinking*[/cyan]",
+    InstanceStatus.TOOL_USE: "[magenta]tool~[/magenta]",
+    InstanceStatus.IDLE: "[blue]idle[/blue]",
+    InstanceStatus.STOPPED: "[red]stopped[/red]",
+    InstanceStatus.ERROR: "[red]error![/red]",
+}
+
+# /help output, parsed and highlighted once as RichLog would do for the markup string
+HELP_TEXT = ReprHighlighter()(Text.from_markup("""[bold]rushd Commands:[/bold]
+
+[cyan]/new[/cyan] [-n name] [-d dir]  Create new Claude Code instance
+[cyan]/switch[/cyan] <N|name|id>      Switch to instance (or just /N)
+[cyan]/stop[/cyan] [name|id]          Stop instance (current if none specified)
+[cyan]/list[/cyan]                    List all instances
+[cyan]/attach[/cyan]                  Attach to tmux window (Ctrl+B D to detach)
+[cyan]/raw[/cyan]                     Show raw terminal output
+[cyan]/activity[/cyan]                Show structured activity (default)
+[cyan]/quit[/cyan]                    Exit rushd
+
+[bold]Shortcuts:[/bold]
+  /1, /2, /3...  Quick switch to instance by number
+  Ctrl+N         Create new instance
+  Ctrl+C         Quit
+
+[bold]Display Modes:[/bold]
+  [magenta]activity[/magenta] - Shows parsed log entries (thinking, tools, responses)
+  [magenta]raw[/magenta]      - Shows actual terminal output from tmux
+
+[bold]Sending Messages:[/bold]
+  Just type and press Enter to send to the selected instance.
+"""))
+
+READY_STATUS = "Ready. Type /new to create an instance."
+
+# Output fetched per poll: enough activity entries / pane lines to fill the output
+# widget this many times over, capped at these counts (also used before layout)
+OUTPUT_FETCH_SCREENS = 3
+ACTIVITY_MAX_ENTRIES = 50
+RAW_MAX_LINES = 200
+
+# Seconds until the next output poll: soon after output changed, slower while it is quiet
+POLL_ACTIVE_INTERVAL = 0.1
+POLL_IDLE_INTERVAL = 0.5
+
+
+def _appended_lines(old: list[str], new: list[str]) -> Optional[list[str]]:
+    """Lines that new adds after old, or None if new does not continue old.
+
+    new continues old when a suffix of old is a prefix of new: old with lines
+    dropped from the start (the last-N window sliding on) and lines added at the end.
+    The longest such overlap is used.
+    """
+    if not old:
+        return None
+    last = old[-1]
+    for end in range(min(len(old), len(new)), 0, -1):
+        if new[end - 1] == last and new[:end] == old[-end:]:
+            return new[end:]
+    return None
+
 
 class InstanceTabs(Static):
     """Widget showing instance tabs at the top."""
@@ -34,15 +100,36 @@ class InstanceTabs(Static):
         self.manager = manager
         self.selected_id: Optional[str] = None
         self.display_mode: DisplayMode = DisplayMode.ACTIVITY
+        # What the current tabs text was built from; an equal refresh is skipped
+        self._shown: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         yield Horizontal(id="tabs-container")
 
-    def refresh_tabs(self, selected_id: Optional[str] = None, display_mode: DisplayMode = DisplayMode.ACTIVITY) -> None:
-        """Refresh the tabs display with status indicators."""
+    def refresh_tabs(
+        self,
+        selected_id: Optional[str] = None,
+        display_mode: DisplayMode = DisplayMode.ACTIVITY,
+        instances: Optional[list[InstanceMetadata]] = None,
+    ) -> None:
+        """Refresh the tabs display with status indicators.
+
+        Pass instances when the caller already has an up-to-date list, to skip the tmux sync.
+        """
         self.selected_id = selected_id
         self.display_mode = display_mode
-        instances = self.manager.list_instances()
+        if instances is None:
+            instances = self.manager.list_instances()
+
+        # The poll refreshes the tabs several times a second, and they rarely change
+        shown = (
+            selected_id,
+            display_mode,
+            tuple((inst.id, inst.name, inst.status) for inst in instances),
+        )
+        if shown == self._shown:
+            return
+        self._shown = shown
 
         tabs_text = Text()
         tabs_text.append("Instances: ", style="bold")
@@ -51,7 +138,7 @@ class InstanceTabs(Static):
             tabs_text.append("[none]", style="dim")
         else:
             for i, inst in enumerate(instances, 1):
-                name = inst.name or inst.id[:8]
+                name = inst.display_name
                 is_selected = inst.id == selected_id
 
                 # Get status indicator
@@ -84,8 +171,11 @@ class InstanceTabs(Static):
 class OutputDisplay(RichLog):
     """Scrollable output display for instance output."""
 
+    # New activity is appended rather than redrawn, so bound the scrollback kept
+    MAX_LINES = 1000
+
     def __init__(self, **kwargs):
-        super().__init__(highlight=True, markup=True, wrap=True, **kwargs)
+        super().__init__(highlight=True, markup=True, wrap=True, max_lines=self.MAX_LINES, **kwargs)
 
 
 class RushdApp(App):
@@ -131,6 +221,24 @@ class RushdApp(App):
         Binding("escape", "clear_input", "Clear"),
     ]
 
+    # Slash command (and alias) -> handler(app, args)
+    COMMANDS: dict[str, Callable[["RushdApp", str], None]] = {
+        "quit": lambda app, args: app.exit(),
+        "q": lambda app, args: app.exit(),
+        "new": lambda app, args: app._create_instance(args),
+        "stop": lambda app, args: app._stop_instance(args),
+        "list": lambda app, args: app._list_instances(),
+        "ls": lambda app, args: app._list_instances(),
+        "switch": lambda app, args: app._switch_instance(args),
+        "s": lambda app, args: app._switch_instance(args),
+        "attach": lambda app, args: app._attach_instance(),
+        "a": lambda app, args: app._attach_instance(),
+        "raw": lambda app, args: app._set_display_mode(DisplayMode.RAW),
+        "activity": lambda app, args: app._set_display_mode(DisplayMode.ACTIVITY),
+        "help": lambda app, args: app._show_help(),
+        "h": lambda app, args: app._show_help(),
+    }
+
     def __init__(self, session_name: Optional[str] = None):
         super().__init__()
         self._config = ConfigManager()
@@ -141,7 +249,14 @@ class RushdApp(App):
         self._output_widget: Optional[OutputDisplay] = None
         self._tabs_widget: Optional[InstanceTabs] = None
         self._status_widget: Optional[Static] = None
+        self._status: str = READY_STATUS
+        # Output last written to the output widget. In activity mode this is the
+        # manager's cached text itself, so holding it costs no extra copy.
         self._last_output: str = ""
+        # False while the widget shows something else (/list, /help)
+        self._output_shown: bool = False
+        # Running instances as of the last poll or change made here; None until refilled
+        self._instances: Optional[list[InstanceMetadata]] = None
         self._display_mode: DisplayMode = DisplayMode.ACTIVITY
 
     def compose(self) -> ComposeResult:
@@ -152,7 +267,7 @@ class RushdApp(App):
             Input(placeholder="Type message, or: /switch N, /new, /stop, /list, /attach, /quit", id="message-input"),
             id="input-container"
         )
-        yield Static("Ready. Type /new to create an instance.", id="status-bar")
+        yield Static(READY_STATUS, id="status-bar")
         yield Footer()
 
     def on_mount(self) -> None:
@@ -161,51 +276,143 @@ class RushdApp(App):
         self._tabs_widget = self.query_one("#instance-tabs", InstanceTabs)
         self._status_widget = self.query_one("#status-bar", Static)
 
-        # Refresh tabs
-        self._refresh_tabs()
-
         # Auto-select first instance if any
-        instances = self.manager.list_instances()
+        instances = self._get_instances()
         if instances:
             self.selected_instance = instances[0].id
-            self._refresh_tabs()
+
+        # Refresh tabs
+        self._refresh_tabs()
 
         # Start output polling
-        self.set_interval(0.5, self._poll_output)
+        self._schedule_poll()
 
         # Focus the input
         self.query_one("#message-input", Input).focus()
 
+    def _get_instances(self) -> list[InstanceMetadata]:
+        """Running instances, synced with tmux only when the cached list was invalidated."""
+        if self._instances is None:
+            self._instances = self.manager.list_instances()
+        return self._instances
+
     def _refresh_tabs(self) -> None:
         """Refresh the instance tabs."""
         if self._tabs_widget:
-            self._tabs_widget.refresh_tabs(self.selected_instance, self._display_mode)
+            self._tabs_widget.refresh_tabs(
+                self.selected_instance, self._display_mode, self._get_instances()
+            )
+
+    def _schedule_poll(self, changed: bool = False) -> None:
+        """Arm the next output poll.
+
+        Each poll schedules the next one when it finishes, so a slow tmux call
+        delays polling instead of letting ticks queue up behind it.
+        """
+        delay = POLL_ACTIVE_INTERVAL if changed else POLL_IDLE_INTERVAL
+        self.set_timer(delay, self._poll_tick)
+
+    def _poll_tick(self) -> None:
+        """Start one output poll on a worker thread.
+
+        Status refreshes, tmux captures and log reads can take a while, so they run
+        off the event loop and typing stays responsive; _apply_poll shows the result.
+        """
+        fetch = None
+        if self.selected_instance and self._output_widget:
+            if self._display_mode == DisplayMode.ACTIVITY:
+                size = self._fetch_size(ACTIVITY_MAX_ENTRIES)
+            else:
+                size = self._fetch_size(RAW_MAX_LINES)
+            fetch = (self.selected_instance, self._display_mode, size)
+        self.run_worker(lambda: self._poll_backend(fetch), thread=True, group="poll")
 
-    def _poll_output(self) -> None:
-        """Poll and update output from selected instance."""
-        # Refresh activity statuses on each poll
-        self.manager.refresh_statuses()
-        self._refresh_tabs()
+    def _poll_backend(self, fetch: Optional[tuple[str, DisplayMode, int]]) -> None:
+        """Worker thread: refresh statuses, fetch output, and hand both to the UI thread."""
+        # Commands keep using the manager on the UI thread meanwhile; the parts it shares
+        # (the tmux control pipe, the store lock) serialize single calls, not this poll
 
-        if not self.selected_instance or not self._output_widget:
-            return
+        # Refresh activity statuses on each poll; the store is then in sync with tmux,
+        # so the tabs read it directly instead of syncing again through list_instances
+        self.manager.refresh_statuses()
+        instances = self.manager.store.list_all()
 
         # Get output based on display mode
-        if self._display_mode == DisplayMode.ACTIVITY:
-            output = self.manager.get_activity_formatted(self.selected_instance, last_n=50)
-        else:
-            output = self.manager.capture_output(self.selected_instance, lines=200)
+        output = None
+        if fetch is not None:
+            instance_id, mode, size = fetch
+            if mode == DisplayMode.ACTIVITY:
+                output = self.manager.get_activity_formatted(instance_id, last_n=size)
+            else:
+                output = self.manager.capture_output(instance_id, lines=size)
+        self.call_from_thread(self._apply_poll, instances, fetch, output)
+
+    def _apply_poll(
+        self,
+        instances: list[InstanceMetadata],
+        fetch: Optional[tuple[str, DisplayMode, int]],
+        output: Optional[str],
+    ) -> None:
+        """Show a finished poll's results and schedule the next poll."""
+        changed = False
+        with self.batch_update():
+            self._instances = instances
+            self._refresh_tabs()
 
-        # Only update if changed
-        if output != self._last_output:
-            self._last_output = output
-            self._output_widget.clear()
-            self._output_widget.write(output)
-            self._output_widget.scroll_end()
+            # Only update if changed, and only for the selection and mode it was fetched for
+            selection = (self.selected_instance, self._display_mode)
+            if fetch is not None and fetch[:2] == selection and output != self._last_output:
+                self._render_output(output)
+                changed = True
+        self._schedule_poll(changed)
+
+    def _fetch_size(self, cap: int) -> int:
+        """How many entries or lines to fetch for the output widget's current height."""
+        height = self._output_widget.size.height
+        return min(cap, height * OUTPUT_FETCH_SCREENS) if height else cap
+
+    def _render_output(self, output: str) -> None:
+        """Show new output, writing only the added lines when activity just grew.
+
+        RichLog re-renders every line after clear(), while the activity view is an
+        append-only log whose usual change is a few entries at the end. Raw pane
+        captures are redrawn in full, since the screen is rewritten in place.
+        """
+        widget = self._output_widget
+        # Follow new output only while the user has not scrolled up to read earlier lines
+        follow = widget.scroll_y >= widget.max_scroll_y - 1
+        added = None
+        # An empty _last_output means a forced refresh (switch, mode change)
+        if self._last_output and self._output_shown and self._display_mode == DisplayMode.ACTIVITY:
+            added = _appended_lines(self._last_output.split("\n"), output.split("\n"))
+        if added is None:
+            scroll_y = widget.scroll_y
+            widget.clear()
+            widget.write(self._output_text(output), scroll_end=follow)
+            if not follow:
+                widget.scroll_to(y=scroll_y, animate=False)
+        elif added:
+            widget.write(self._output_text("\n".join(added)), scroll_end=follow)
+        self._last_output = output
+        self._output_shown = True
+
+    def _output_text(self, output: str) -> Text:
+        """Instance output as Text, skipping the markup parse RichLog gives a str.
+
+        Neither view is markup: logs and terminals are full of literal brackets. Only
+        raw pane text gets the highlighter's regex pass; activity lines are short
+        summaries with their own icons.
+        """
+        text = Text(output)
+        if self._display_mode == DisplayMode.RAW:
+            text = self._output_widget.highlighter(text)
+        return text
 
     def _set_status(self, message: str) -> None:
         """Update the status bar."""
-        if self._status_widget:
+        # Repeating the shown message (e.g. "Message sent") skips the widget update
+        if self._status_widget and message != self._status:
+            self._status = message
             self._status_widget.update(message)
 
     @on(Input.Submitted, "#message-input")
@@ -215,14 +422,17 @@ class RushdApp(App):
         if not text:
             return
 
-        # Clear input
-        event.input.value = ""
+        # Commands change the selection, tabs, output and status bar together;
+        # batch_update paints them in one screen update instead of one per widget
+        with self.batch_update():
+            # Clear input
+            event.input.value = ""
 
-        # Handle commands
-        if text.startswith("/"):
-            self._handle_command(text)
-        else:
-            self._send_message(text)
+            # Handle commands
+            if text.startswith("/"):
+                self._handle_command(text)
+            else:
+                self._send_message(text)
 
     def _handle_command(self, cmd: str) -> None:
         """Process slash commands."""
@@ -235,36 +445,21 @@ class RushdApp(App):
             self._switch_to_index(int(command))
             return
 
-        if command == "quit" or command == "q":
-            self.exit()
-        elif command == "new":
-            self._create_instance(args)
-        elif command == "stop":
-            self._stop_instance(args)
-        elif command == "list" or command == "ls":
-            self._list_instances()
-        elif command == "switch" or command == "s":
-            self._switch_instance(args)
-        elif command == "attach" or command == "a":
-            self._attach_instance()
-        elif command == "raw":
-            self._set_display_mode(DisplayMode.RAW)
-        elif command == "activity":
-            self._set_display_mode(DisplayMode.ACTIVITY)
-        elif command == "help" or command == "h":
-            self._show_help()
+        handler = self.COMMANDS.get(command)
+        if handler is not None:
+            handler(self, args)
         else:
             self._set_status(f"Unknown command: /{command}. Type /help for commands.")
 
     def _switch_to_index(self, index: int) -> None:
         """Switch to instance by 1-based index."""
-        instances = self.manager.list_instances()
+        instances = self._get_instances()
         if 1 <= index <= len(instances):
             self.selected_instance = instances[index - 1].id
             self._refresh_tabs()
             self._last_output = ""  # Force refresh
             inst = instances[index - 1]
-            name = inst.name or inst.id[:8]
+            name = inst.display_name
             self._set_status(f"Switched to [{index}] {name}")
         else:
             self._set_status(f"No instance at index {index}")
@@ -286,7 +481,7 @@ class RushdApp(App):
             self.selected_instance = instance.id
             self._refresh_tabs()
             self._last_output = ""
-            name = instance.name or instance.id[:8]
+            name = instance.display_name
             self._set_status(f"Switched to {name}")
         else:
             self._set_status(f"Instance not found: {identifier}")
@@ -296,8 +491,12 @@ class RushdApp(App):
         name = None
         working_dir = None
 
-        # Parse simple args: -n name -d dir
-        parts = args.split()
+        # Parse simple args: -n name -d dir (quoted like a shell, for paths with spaces)
+        try:
+            parts = shlex.split(args)
+        except ValueError as e:
+            self._set_status(f"Invalid arguments: {e}")
+            return
         i = 0
         while i < len(parts):
             if parts[i] == "-n" and i + 1 < len(parts):
@@ -321,10 +520,11 @@ class RushdApp(App):
 
         try:
             instance = self.manager.start_instance(name=name, working_dir=working_dir)
+            self._instances = None
             self.selected_instance = instance.id
             self._refresh_tabs()
             self._last_output = ""
-            display_name = instance.name or instance.id[:8]
+            display_name = instance.display_name
             self._set_status(f"Created instance: {display_name}")
         except Exception as e:
             self._set_status(f"Error creating instance: {e}")
@@ -342,7 +542,8 @@ class RushdApp(App):
         if self.manager.stop_instance(identifier):
             self._set_status(f"Stopped instance: {identifier}")
             # Select next available instance
-            instances = self.manager.list_instances()
+            self._instances = None
+            instances = self._get_instances()
             if instances:
                 self.selected_instance = instances[0].id
             else:
@@ -357,25 +558,18 @@ class RushdApp(App):
     def _list_instances(self) -> None:
         """Show list of instances in output."""
         self.manager.refresh_statuses()
-        instances = self.manager.list_instances(include_stopped=True)
+        instances = self.manager.store.list_all(include_stopped=True)
         if not instances:
             self._set_status("No instances. Type /new to create one.")
             return
 
         if self._output_widget:
             self._output_widget.clear()
+            self._output_shown = False
             self._output_widget.write("[bold]Instances:[/bold]\n")
             for i, inst in enumerate(instances, 1):
-                name = inst.name or inst.id[:8]
-                status_display = {
-                    InstanceStatus.RUNNING: "[green]running[/green]",
-                    InstanceStatus.STARTING: "[yellow]starting...[/yellow]",
-                    InstanceStatus.THINKING: "[cyan]thinking*[/cyan]",
-                    InstanceStatus.TOOL_USE: "[magenta]tool~[/magenta]",
-                    InstanceStatus.IDLE: "[blue]idle[/blue]",
-                    InstanceStatus.STOPPED: "[red]stopped[/red]",
-                    InstanceStatus.ERROR: "[red]error![/red]",
-                }.get(inst.status, str(inst.status))
+                name = inst.display_name
+                status_display = STATUS_DISPLAY.get(inst.status, str(inst.status))
                 selected = "*" if inst.id == self.selected_instance else " "
                 self._output_widget.write(
                     f"  {selected}[{i}] {name} - {status_display} - {inst.working_dir}\n"
@@ -416,29 +610,8 @@ class RushdApp(App):
         """Show help in output."""
         if self._output_widget:
             self._output_widget.clear()
-            self._output_widget.write("""[bold]rushd Commands:[/bold]
-
-[cyan]/new[/cyan] [-n name] [-d dir]  Create new Claude Code instance
-[cyan]/switch[/cyan] <N|name|id>      Switch to instance (or just /N)
-[cyan]/stop[/cyan] [name|id]          Stop instance (current if none specified)
-[cyan]/list[/cyan]                    List all instances
-[cyan]/attach[/cyan]                  Attach to tmux window (Ctrl+B D to detach)
-[cyan]/raw[/cyan]                     Show raw terminal output
-[cyan]/activity[/cyan]                Show structured activity (default)
-[cyan]/quit[/cyan]                    Exit rushd
-
-[bold]Shortcuts:[/bold]
-  /1, /2, /3...  Quick switch to instance by number
-  Ctrl+N         Create new instance
-  Ctrl+C         Quit
-
-[bold]Display Modes:[/bold]
-  [magenta]activity[/magenta] - Shows parsed log entries (thinking, tools, responses)
-  [magenta]raw[/magenta]      - Shows actual terminal output from tmux
-
-[bold]Sending Messages:[/bold]
-  Just type and press Enter to send to the selected instance.
-""")
+            self._output_shown = False
+            self._output_widget.write(HELP_TEXT)
 
     def action_new_instance(self) -> None:
         """Create a new instance (keyboard shortcut)."""
@@ -456,4 +629,9 @@ class RushdApp(App):
 def run_tui(session_name: Optional[str] = None) -> Optional[str]:
     """Run the TUI and return the result (e.g., 'attach' if user wants to attach)."""
     app = RushdApp(session_name)
-    return app.run()
+    result = app.run()
+
+    # Handle attach request by reusing the app's manager and selection
+    if result == "attach" and app.selected_instance:
+        app.manager.attach(app.selected_instance)
+    return result
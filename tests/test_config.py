@@ -0,0 +1,40 @@
+"""Tests for the shared parsed-config cache."""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from rushd.config import ConfigManager, RushdConfig  # noqa: E402
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigManager, "_cache", {})
+    monkeypatch.setattr(ConfigManager, "_dump_cache", {})
+    return ConfigManager(tmp_path / "config.json")
+
+
+def test_same_size_rewrite_in_racy_window_is_seen(manager):
+    config = RushdConfig()
+    config.primary.name = "aaaa"
+    manager.save(config)
+    assert manager.load().primary.name == "aaaa"
+    st = manager.config_path.stat()
+    # Another process rewrites the file with the same size and mtime
+    data = manager.config_path.read_bytes().replace(b'"aaaa"', b'"bbbb"')
+    manager.config_path.write_bytes(data)
+    os.utime(manager.config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert manager.load().primary.name == "bbbb"
+    assert b'"bbbb"' in manager.dump_json()
+
+
+def test_old_file_is_trusted_and_reused(manager):
+    manager.save(RushdConfig())
+    past = time.time() - 10
+    os.utime(manager.config_path, (past, past))
+    first = manager.load()
+    assert manager._cache[manager.config_path][2] is True
+    assert manager.load() is first
@@ -0,0 +1,134 @@
+"""Tests for reading Claude Code session logs."""
+
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+from rushd.logs import ClaudeLogReader, LogCursor, _tail_lines, _tail_start
+
+
+def entry_line(text: str, entry_id: str = "") -> str:
+    return json.dumps({
+        "type": "user",
+        "timestamp": "2026-01-01T00:00:00Z",
+        "uuid": entry_id or str(uuid.uuid4()),
+        "message": {"content": text},
+    }) + "\n"
+
+
+@pytest.fixture
+def reader(tmp_path, monkeypatch):
+    """A reader whose CLAUDE_DIR is a temp dir, with the shared caches emptied."""
+    monkeypatch.setattr(ClaudeLogReader, "CLAUDE_DIR", tmp_path / ".claude")
+    for name in ("_entry_cache", "_latest_cache", "_latest_entry_cache", "_entries_cache"):
+        monkeypatch.setattr(ClaudeLogReader, name, type(getattr(ClaudeLogReader, name))())
+    log_reader = ClaudeLogReader(tmp_path / "work")
+    log_reader.project_dir.mkdir(parents=True)
+    return log_reader
+
+
+def new_session(log_reader: ClaudeLogReader, content: str = "") -> Path:
+    path = log_reader.project_dir / f"{uuid.uuid4()}.jsonl"
+    path.write_text(content)
+    # find_latest_session caches per dir mtime; forget it so the new file is seen
+    ClaudeLogReader._latest_cache.clear()
+    return path
+
+
+@pytest.mark.parametrize(
+    "content, n, expected",
+    [
+        (b"a\nb\nc\n", 2, [b"b", b"c"]),
+        (b"a\nb\nc", 2, [b"b", b"c"]),
+        (b"a\nb\n", 5, [b"a", b"b"]),
+        (b"\na\n", 5, [b"", b"a"]),
+        (b"a\n", 0, []),
+        (b"", 3, []),
+    ],
+)
+def test_tail_lines(tmp_path, content, n, expected):
+    path = tmp_path / "f"
+    path.write_bytes(content)
+    assert _tail_lines(path, n) == expected
+
+
+@pytest.mark.parametrize(
+    "content, n, expected",
+    [
+        (b"a\nb\nc\n", 2, 2),
+        (b"a\nb\nc\n", 3, 0),
+        (b"a\nb\nc\n", 10, 0),
+        (b"a\nb\nc", 1, 4),
+        (b"a\n", 0, 2),
+    ],
+)
+def test_tail_start(tmp_path, content, n, expected):
+    path = tmp_path / "f"
+    path.write_bytes(content)
+    with open(path, "rb") as f:
+        assert _tail_start(f, len(content), n) == expected
+
+
+def test_tail_start_empty_file(tmp_path):
+    path = tmp_path / "f"
+    path.write_bytes(b"")
+    with open(path, "rb") as f:
+        assert _tail_start(f, 0, 3) == 0
+
+
+def test_read_entries_since_returns_only_appended_lines(reader):
+    session = new_session(reader, entry_line("old"))
+    cursor = reader.end_cursor()
+    assert cursor == LogCursor(session, session.stat().st_size)
+
+    entries, cursor = reader.read_entries_since(cursor)
+    assert entries == []
+
+    with open(session, "a") as f:
+        f.write(entry_line("one") + entry_line("two"))
+    entries, cursor = reader.read_entries_since(cursor)
+    assert [e.user_message for e in entries] == ["one", "two"]
+    assert cursor.offset == session.stat().st_size
+
+
+def test_read_entries_since_leaves_partial_line(reader):
+    session = new_session(reader)
+    cursor = reader.end_cursor()
+    line = entry_line("done")
+    with open(session, "a") as f:
+        f.write(line[:10])
+    entries, cursor = reader.read_entries_since(cursor)
+    assert entries == []
+    assert cursor.offset == 0
+
+    with open(session, "a") as f:
+        f.write(line[10:])
+    entries, cursor = reader.read_entries_since(cursor)
+    assert [e.user_message for e in entries] == ["done"]
+
+
+def test_read_entries_since_caps_session_switch(reader, monkeypatch):
+    monkeypatch.setattr(ClaudeLogReader, "SESSION_SWITCH_LINES", 3)
+    new_session(reader, entry_line("first"))
+    cursor = reader.end_cursor()
+
+    new_session(reader, "".join(entry_line(str(i)) for i in range(10)))
+    entries, cursor = reader.read_entries_since(cursor)
+    assert [e.user_message for e in entries] == ["7", "8", "9"]
+
+
+def test_read_entries_since_rereads_shrunken_log(reader, monkeypatch):
+    monkeypatch.setattr(ClaudeLogReader, "SESSION_SWITCH_LINES", 2)
+    session = new_session(reader, "".join(entry_line(str(i)) for i in range(5)))
+    cursor = reader.end_cursor()
+    session.write_text(entry_line("a") + entry_line("b") + entry_line("c"))
+    entries, _ = reader.read_entries_since(LogCursor(session, cursor.offset))
+    assert [e.user_message for e in entries] == ["b", "c"]
+
+
+def test_dedupe_key_set_at_parse_time(reader):
+    new_session(reader, entry_line("x", entry_id="fixed-id"))
+    (entry,) = reader.read_entries()
+    assert entry.dedupe_key == hash("fixed-id")
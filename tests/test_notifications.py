@@ -0,0 +1,80 @@
+"""Tests for the notification store's listing and parse caches."""
+
+import os
+import time
+import uuid
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from rushd.config import RACY_MTIME_NS, mtime_trusted  # noqa: E402
+from rushd.models import Notification, NotificationStatus  # noqa: E402
+from rushd.notifications import NotificationStore  # noqa: E402
+
+
+def make_notification(message: str) -> Notification:
+    return Notification(
+        id=str(uuid.uuid4()),
+        worker_id="aaaa1111",
+        worker_name="worker",
+        status=NotificationStatus.SUCCESS,
+        message=message,
+    )
+
+
+def age_path(path, seconds: float = 10) -> None:
+    """Push a file or directory mtime into the past, beyond the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(NotificationStore, "_cache", {})
+    monkeypatch.setattr(NotificationStore, "_listing_cache", {})
+    return NotificationStore(tmp_path / "notifications")
+
+
+def test_mtime_trusted():
+    now = time.time_ns()
+    assert mtime_trusted(now - 2 * RACY_MTIME_NS, now)
+    assert not mtime_trusted(now, now)
+
+
+def test_fresh_directory_listing_is_not_cached(store):
+    store.save(make_notification("one"))
+    assert len(store.list_notifications()) == 1
+    assert store.store_dir not in store._listing_cache
+
+
+def test_quiet_directory_listing_is_cached(store):
+    store.save(make_notification("one"))
+    age_path(store.store_dir)
+    files = store._list_files()
+    assert store._listing_cache[store.store_dir][1] is files
+    assert store._list_files() is files
+
+
+def test_new_file_changes_listing(store):
+    store.save(make_notification("one"))
+    age_path(store.store_dir)
+    store.list_notifications()
+    store.save(make_notification("two"))
+    messages = {n.message for n in store.list_notifications()}
+    assert messages == {"one", "two"}
+
+
+def test_old_notification_is_cached_and_reused(store):
+    path = store.save(make_notification("one"))
+    age_path(path)
+    first = store.list_notifications()[0]
+    assert store.list_notifications()[0] is first
+
+
+def test_mark_delivered_is_seen(store):
+    notification = make_notification("one")
+    path = store.save(notification)
+    store.list_notifications()
+    store.mark_delivered(path, notification)
+    assert store.list_notifications(undelivered_only=True) == []
@@ -0,0 +1,66 @@
+"""Tests for detecting output that only scrolled (rushd view / the TUI output pane)."""
+
+import pytest
+
+from rushd.cli import _appended_lines
+
+
+def test_extension_of_complete_line():
+    assert _appended_lines("a\nb\n", "a\nb\nc\n") == "c\n"
+
+
+def test_extension_on_new_line():
+    assert _appended_lines("a\nb", "a\nb\nc") == "c"
+
+
+def test_leading_blank_lines_are_kept():
+    assert _appended_lines("a\n", "a\n\nb\n") == "\nb\n"
+    assert _appended_lines("a", "a\n\n\nb") == "\n\nb"
+
+
+def test_partial_last_line_is_not_appended():
+    # old's last line was still being written; its continuation is not a new line
+    assert _appended_lines("a\nb", "a\nbc") is None
+
+
+def test_scroll_with_enough_overlap():
+    old = "a\nb\nc\nd"
+    new = "b\nc\nd\ne"
+    assert _appended_lines(old, new) == "e"
+
+
+def test_short_overlap_is_not_a_scroll():
+    # A single repeated line (e.g. the prompt) must not count as a scroll
+    assert _appended_lines("a\nb", "b\nc") is None
+
+
+def test_empty_old():
+    assert _appended_lines("", "a") is None
+
+
+def test_unrelated_output():
+    assert _appended_lines("a\nb\nc\nd\ne", "v\nw\nx\ny\nz") is None
+
+
+class TestTuiAppendedLines:
+    @pytest.fixture(autouse=True)
+    def _tui(self):
+        pytest.importorskip("textual")
+        from rushd import tui
+
+        self.appended = tui._appended_lines
+
+    def test_window_slides(self):
+        assert self.appended(["a", "b", "c"], ["b", "c", "d"]) == ["d"]
+
+    def test_unchanged(self):
+        assert self.appended(["a", "b"], ["a", "b"]) == []
+
+    def test_longest_overlap_wins(self):
+        assert self.appended(["x", "x"], ["x", "x", "y"]) == ["y"]
+
+    def test_no_overlap(self):
+        assert self.appended(["a", "b"], ["c", "d"]) is None
+
+    def test_empty_old(self):
+        assert self.appended([], ["a"]) is None
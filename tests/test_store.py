@@ -0,0 +1,75 @@
+"""Tests for the instance store's parsed-file cache."""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from rushd.models import InstanceMetadata  # noqa: E402
+from rushd.store import InstanceStore  # noqa: E402
+
+
+def make_instance(instance_id: str, name: str) -> InstanceMetadata:
+    return InstanceMetadata(
+        id=instance_id,
+        full_id=instance_id * 4,
+        name=name,
+        working_dir="/tmp",
+        tmux_window=f"rushd-instances:{name}",
+    )
+
+
+def age_file(path, seconds: float = 10) -> None:
+    """Push a file's mtime into the past, beyond the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(InstanceStore, "_cache", {})
+    monkeypatch.setattr(InstanceStore, "_index_cache", {})
+    instance_store = InstanceStore(tmp_path / "instances.json")
+    yield instance_store
+    instance_store.close()
+
+
+def test_fresh_file_is_cached_untrusted(store):
+    store.add(make_instance("aaaa1111", "one"))
+    store.load()
+    assert store._cache[store.store_path][2] is False
+
+
+def test_old_file_is_trusted_and_reused(store):
+    store.add(make_instance("aaaa1111", "one"))
+    age_file(store.store_path)
+    first = store._read()
+    assert store._cache[store.store_path][2] is True
+    assert store._read() is first
+
+
+def test_untrusted_file_with_same_bytes_reuses_parse(store):
+    store.add(make_instance("aaaa1111", "one"))
+    first = store._read()
+    assert store._read() is first
+
+
+def test_same_size_rewrite_in_racy_window_is_seen(store):
+    store.add(make_instance("aaaa1111", "one"))
+    store.load()
+    st = store.store_path.stat()
+    # Another process rewrites the file with the same size and mtime
+    data = store.store_path.read_bytes().replace(b'"one"', b'"two"')
+    store.store_path.write_bytes(data)
+    os.utime(store.store_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert store.get("aaaa1111").name == "two"
+
+
+def test_write_drops_cache(store):
+    store.add(make_instance("aaaa1111", "one"))
+    store.load()
+    store.update("aaaa1111", name="renamed")
+    assert store.store_path not in store._cache
+    assert store.find_by_name("renamed").id == "aaaa1111"
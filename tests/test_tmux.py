@@ -0,0 +1,108 @@
+"""Tests for the tmux control-mode client."""
+
+import io
+import shutil
+import subprocess
+import uuid
+
+import pytest
+
+from rushd.tmux import TmuxControlClient, _quote_tmux_arg
+
+
+class FakeProc:
+    """Stands in for the tmux -C process: records stdin, replays canned stdout."""
+
+    def __init__(self, stdout_lines: list[str]):
+        self.stdin = io.StringIO()
+        self.stdout = iter(stdout_lines)
+        self.waited = False
+
+    def wait(self):
+        self.waited = True
+
+
+def make_client(stdout_lines: list[str]) -> tuple[TmuxControlClient, FakeProc]:
+    client = TmuxControlClient("test")
+    proc = FakeProc(stdout_lines)
+    client._proc = proc
+    return client, proc
+
+
+@pytest.mark.parametrize(
+    "arg, expected",
+    [
+        ("plain", "'plain'"),
+        ("", "''"),
+        ("it's", "'it'\\''s'"),
+        ("a b;c", "'a b;c'"),
+        ("#{pane_id} $HOME", "'#{pane_id} $HOME'"),
+    ],
+)
+def test_quote_tmux_arg(arg, expected):
+    assert _quote_tmux_arg(arg) == expected
+
+
+def test_run_returns_framed_output():
+    client, proc = make_client([
+        "%begin 1700000000 12 1\n",
+        "line one\n",
+        "line two\n",
+        "%end 1700000000 12 1\n",
+    ])
+    assert client.run(["list-windows", "-t", "s"]) == ("line one\nline two", 0)
+    assert proc.stdin.getvalue() == "'list-windows' '-t' 's'\n"
+
+
+def test_run_skips_notifications_outside_frame():
+    client, _ = make_client([
+        "%window-add @3\n",
+        "%begin 1700000000 13 1\n",
+        "out\n",
+        "%end 1700000000 13 1\n",
+    ])
+    assert client.run(["has-session"]) == ("out", 0)
+
+
+def test_run_ignores_end_lines_of_other_commands_in_output():
+    # Output that happens to look like a frame line for another command number
+    client, _ = make_client([
+        "%begin 1700000000 14 1\n",
+        "%end 1700000000 99 1\n",
+        "%end 1700000000 14 1\n",
+    ])
+    assert client.run(["capture-pane"]) == ("%end 1700000000 99 1", 0)
+
+
+def test_run_reports_error_frame_as_failure():
+    client, _ = make_client([
+        "%begin 1700000000 15 1\n",
+        "can't find window: x\n",
+        "%error 1700000000 15 1\n",
+    ])
+    assert client.run(["select-window", "-t", "x"]) == ("", 1)
+
+
+def test_client_exit_before_frame_means_not_sent():
+    client, proc = make_client([])
+    assert client.run(["list-panes"]) is None
+    assert client._proc is None
+    assert proc.waited
+
+
+def test_client_exit_after_frame_is_failure():
+    client, _ = make_client(["%begin 1700000000 16 1\n", "partial\n"])
+    assert client.run(["send-keys", "Enter"]) == ("", 1)
+
+
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+def test_quoted_args_round_trip_through_tmux():
+    session = f"rushd-test-{uuid.uuid4().hex[:8]}"
+    subprocess.run(["tmux", "new-session", "-d", "-s", session], check=True)
+    client = TmuxControlClient(session)
+    try:
+        text = "it's a \"test\" ; $HOME \\ {}"
+        assert client.run(["display-message", "-p", "-t", session, text]) == (text, 0)
+    finally:
+        client.close()
+        subprocess.run(["tmux", "kill-session", "-t", session], check=False)